@@ -49,6 +49,7 @@ json.load to the string in case this happens because the first round of deserial
 otherwise, it will keep it as a string.
 """
 
+import builtins
 import importlib
 import inspect
 import json
@@ -701,6 +702,31 @@ def _convert_arbitrary_obj_to_dict(obj: object) -> Dict[str, Any]:
     return obj_dict
 
 
+# Classes already resolved from their '_class_type' name. Every broadcast carries at least one serialized object, so
+# resolving the class only once keeps the deserialization of the incoming messages cheap.
+_classes_by_type: Dict[str, Any] = {}
+
+
+def _class_from_type(class_type: str) -> Any:
+    """
+    Returns the class named by a '_class_type' string. Dotted names get imported from their module, plain names are
+    looked up in this module and then in the built-ins.
+    """
+    cls = _classes_by_type.get(class_type)
+    if cls is None:
+        # if a dot is present indicates the class is arbitrary and needs to be imported
+        if '.' in class_type:
+            parts = class_type.split('.')
+            mod = importlib.import_module('.'.join(parts[:-1]))
+            cls = getattr(mod, parts[-1])
+        elif class_type in globals():
+            cls = globals()[class_type]
+        else:
+            cls = getattr(builtins, class_type)
+        _classes_by_type[class_type] = cls
+    return cls
+
+
 def _convert_dict_to_obj(item_dict: dict) -> Any:
     """
     Instantiates an object from an object dictionary. The reverse of the _convert_obj_to_dict. The constructor of the
@@ -709,21 +735,19 @@ def _convert_dict_to_obj(item_dict: dict) -> Any:
     Assumes that the dictionary has a key '_class_type' indicating what class it should be instantiated from.
     """
     class_type = item_dict['_class_type']
+    cls = _class_from_type(class_type)
 
-    # if a dot is present indicates the class is arbitrary and needs to be imported
+    # arbitrary classes never get the _class_type argument
     if '.' in class_type:
-        parts = class_type.split('.')
-        mod = importlib.import_module('.'.join(parts[:-1]))
-        cls = getattr(mod, parts[-1])
         item_dict.pop('_class_type')
         return cls(**item_dict)
 
     try:
-        instantiated_obj = eval(f'{class_type}(**item_dict)')
+        instantiated_obj = cls(**item_dict)
     # built-ins (like complex) will not want the _class_type argument
     except TypeError:
-        cls = item_dict.pop('_class_type')
-        instantiated_obj = eval(f'{cls}(**item_dict)')
+        item_dict.pop('_class_type')
+        instantiated_obj = cls(**item_dict)
 
     return instantiated_obj
 
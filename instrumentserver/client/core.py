@@ -1,4 +1,5 @@
 import logging
+import threading
 import warnings
 import zmq
 
@@ -36,6 +37,8 @@ class BaseClient:
         self.raise_exceptions = raise_exceptions
         #: Timeout for server replies.
         self.recv_timeout = timeout
+        # The socket can only handle one request at a time, but GUIs ask from worker threads too.
+        self._lock = threading.RLock()
 
         if connect:
             self.connect()
@@ -57,6 +60,10 @@ class BaseClient:
         self.connected = True
 
     def ask(self, message):
+        with self._lock:
+            return self._ask(message)
+
+    def _ask(self, message):
         if not self.connected:
             raise RuntimeError("No connection yet.")
 
@@ -494,6 +494,9 @@ class SubClient(QtCore.QObject):
     #: emitted when the server broadcast either a new parameter or an update to an existing one.
     update = QtCore.Signal(ParameterBroadcastBluePrint)
 
+    #: Time in ms the update loop waits for a broadcast before checking if it should stop.
+    pollTimeout = 100
+
     def __init__(self, instruments: List[str] = None, sub_host: str = 'localhost', sub_port: int = DEFAULT_PORT + 1):
         """
         Creates a new subscription client.
@@ -510,6 +513,8 @@ class SubClient(QtCore.QObject):
         self.instruments = instruments
 
         self.connected = False
+        # Set from another thread to end the update loop.
+        self._stopRequested = False
 
     def connect(self):
         """
@@ -532,14 +537,55 @@ class SubClient(QtCore.QObject):
 
         self.connected = True
 
-        while self.connected:
-            message = recvMultipart(socket)
-            self.update.emit(message[1])
+        # Poll with a timeout so that a stop request is noticed even when no broadcasts arrive.
+        while not self._stopRequested:
+            if socket.poll(self.pollTimeout):
+                message = recvMultipart(socket)
+                self.update.emit(message[1])
 
-        self.disconnect()
+        self.connected = False
+        socket.close()
 
         return True
 
+    @QtCore.Slot()
+    def stop(self):
+        """
+        Ends the update loop started by `connect`, the socket gets closed within `pollTimeout` ms.
+        """
+        self._stopRequested = True
+
+
+class SubClientRunnable(QtCore.QRunnable):
+    """
+    Runs the update loop of a `SubClient` in a thread pool, see `startSubClient`.
+
+    :param subClient: The subscription client to run.
+    """
+
+    def __init__(self, subClient: SubClient):
+        super().__init__()
+        self.subClient = subClient
+
+    def run(self):
+        self.subClient.connect()
+
+
+#: Shared thread pool hosting the update loops of all subscription clients.
+subClientPool = QtCore.QThreadPool()
+
+
+def startSubClient(subClient: SubClient) -> None:
+    """
+    Runs the update loop of `subClient` in the shared subscription client pool.
+
+    Every update loop keeps its thread busy until the client is stopped, so the pool grows whenever needed
+    instead of queueing new clients behind running ones.
+    """
+    if subClientPool.activeThreadCount() >= subClientPool.maxThreadCount():
+        subClientPool.setMaxThreadCount(subClientPool.activeThreadCount() + 1)
+    subClientPool.start(SubClientRunnable(subClient))
+
 
 class _QtAdapter(QtCore.QObject):
     def __init__(self, parent, *arg, **kw):
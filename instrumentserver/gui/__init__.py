@@ -1,4 +1,10 @@
-from .. import QtCore, QtWidgets, resource
+from typing import Dict, Tuple
+
+from .. import QtCore, QtGui, QtWidgets, resource
+
+
+_icons: Dict[str, QtGui.QIcon] = {}
+_pixmaps: Dict[Tuple[str, int, int], QtGui.QPixmap] = {}
 
 
 def getStyleSheet():
@@ -46,3 +52,41 @@ def keepSmallHorizontally(w: QtWidgets.QWidget):
                               QtWidgets.QSizePolicy.Minimum)
     )
 
+
+def setStyleProperty(w: QtWidgets.QWidget, name: str, value) -> None:
+    """Set the dynamic property ``name`` used in style sheet selectors (like ``QPushButton[error="true"]``)
+    and re-polish ``w`` so the style follows. Nothing happens if the property already has that value.
+
+    Switching a property is much cheaper than calling ``setStyleSheet``, which parses the style sheet again.
+    """
+    if w.property(name) == value:
+        return
+    w.setProperty(name, value)
+    style = w.style()
+    style.unpolish(w)
+    style.polish(w)
+
+
+def getIcon(path: str) -> QtGui.QIcon:
+    """Return the icon found at ``path``, e.g. ``":/icons/delete.svg"``.
+
+    Each icon is only loaded once, and then shared between all the widgets that use it.
+    """
+    icon = _icons.get(path)
+    if icon is None:
+        icon = QtGui.QIcon(path)
+        _icons[path] = icon
+    return icon
+
+
+def getPixmap(path: str, width: int, height: int) -> QtGui.QPixmap:
+    """Return the icon found at ``path`` rendered as a ``width`` x ``height`` pixmap.
+
+    Rendering an svg is the expensive part, so each size of each icon is only rendered once.
+    """
+    key = (path, width, height)
+    pix = _pixmaps.get(key)
+    if pix is None:
+        pix = getIcon(path).pixmap(width, height)
+        _pixmaps[key] = pix
+    return pix
@@ -86,6 +86,8 @@ Things to pay attention when implementing the constructor:
     * Don't forget to call the setItemDelegateForColumn for all the columns that utilize delegates.
     * Don't forget to end the constructor by calling the function setAllDelegatesPersistent,
         if not, the delegates will not be shown.
+    * Delegates only exist for rows that are visible: they get created when their parent gets expanded and closed
+        when it gets collapsed. Don't keep references to them around after they are destroyed.
 
 InstrumentDisplayBase
 ^^^^^^^^^^^^^^^^^^^^^
@@ -102,10 +104,36 @@ To add more items to the toolbar for any extra functionality, you can do so by o
 
 """
 
+import logging
+import re
+import threading
+import weakref
 from pprint import pprint
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any
 
 from instrumentserver import QtCore, QtGui, QtWidgets
+from instrumentserver.gui import getIcon
+
+
+logger = logging.getLogger(__name__)
+
+
+_instrumentLocks: "weakref.WeakKeyDictionary[Any, threading.RLock]" = weakref.WeakKeyDictionary()
+_instrumentLocksGuard = threading.Lock()
+
+
+def instrumentLock(instrument) -> threading.RLock:
+    """
+    Returns the lock of `instrument`. Updating the instrument, adding or removing its parameters and reading its
+    parameter and submodule dictionaries must happen while holding it, since the GUI does some of these in the
+    global thread pool. All the models and widgets of the same instrument get the same lock.
+    """
+    with _instrumentLocksGuard:
+        lock = _instrumentLocks.get(instrument)
+        if lock is None:
+            lock = threading.RLock()
+            _instrumentLocks[instrument] = lock
+        return lock
 
 
 class ItemBase(QtGui.QStandardItem):
@@ -135,8 +163,39 @@ class ItemBase(QtGui.QStandardItem):
 class DelegateBase(QtWidgets.QStyledItemDelegate):
     """
     The parent of the delegate should be the view. The signals should go through the view too.
+
+    Every row of the view gets the height of the editors of the delegate (see `sampleEditor`), whether the row has an
+    editor or not. That way all rows have the same height and the view can use uniform row heights.
     """
 
+    #: Height of the editors of this delegate, see `editorHeight`.
+    _editorHeight: Optional[int] = None
+
+    def sampleEditor(self) -> Optional[QtWidgets.QWidget]:
+        """
+        Creates an editor like the ones of this delegate, only used to measure its height. Delegates that do not create
+        editors taller than a line of text return ``None``.
+        """
+        return None
+
+    def editorHeight(self) -> int:
+        """
+        Height of the editors of this delegate, measured once from `sampleEditor`. 0 if there is no sample editor.
+        """
+        if self._editorHeight is None:
+            editor = self.sampleEditor()
+            if editor is None:
+                self._editorHeight = 0
+            else:
+                self._editorHeight = editor.sizeHint().height()
+                editor.deleteLater()
+        return self._editorHeight
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        size = super().sizeHint(option, index)
+        size.setHeight(max(size.height(), self.editorHeight()))
+        return size
+
     @classmethod
     def getItem(cls, QModelIndex):
 
@@ -153,6 +212,21 @@ class DelegateBase(QtWidgets.QStyledItemDelegate):
 
         return item
 
+    @classmethod
+    def _forgetEditor(cls, editors: Dict[str, QtWidgets.QWidget], editor: QtWidgets.QWidget,
+                      index: QtCore.QModelIndex) -> None:
+        """
+        Removes an editor that is about to be destroyed from the dictionary the delegate keeps its editors in.
+        """
+        if index.isValid():
+            name = cls.getItem(index).name
+            if editors.get(name) is editor:
+                del editors[name]
+        else:
+            for name, e in list(editors.items()):
+                if e is editor:
+                    del editors[name]
+
 
 class InstrumentModelBase(QtGui.QStandardItemModel):
     """
@@ -194,17 +268,23 @@ class InstrumentModelBase(QtGui.QStandardItemModel):
         super().__init__(parent=parent)
 
         self.instrument = instrument
+        #: Guards the instrument, see `instrumentLock`.
+        self.instrumentLock = instrumentLock(instrument)
         # Indicates the name of the attributes we are creating the model: Parameters or methods for now.
         self.attr = attr
         self.objectDictionary = getattr(self.instrument, self.attr)
         self.itemClass: ItemBase = itemClass
 
-        self.itemsStar = itemsStar
-        self.itemsTrash = itemsTrash
-        self.itemsHide = itemsHide
+        # Only ever used for membership tests while loading items, sets make those O(1).
+        self.itemsStar = set(itemsStar)
+        self.itemsTrash = set(itemsTrash)
+        self.itemsHide = set(itemsHide)
 
         self.setHorizontalHeaderLabels([attr])
 
+        # Index of every item in the model (submodule items included) by full name, keeps lookups O(1).
+        self._itemsByName: Dict[str, ItemBase] = {}
+
         # Indicates if when adding items to the model, should pay attention to the itemsStar, itemsTrash or itemsHide.
         self.loadingItems = True
         self.loadItems()
@@ -218,33 +298,96 @@ class InstrumentModelBase(QtGui.QStandardItemModel):
             If `None`, self.instrument will be used.
         :param prefix: any submodule name that should be added before the name of a parameter.
         """
-        if module is None:
-            module = self.instrument
+        for objectName, obj in self.objectsFromModule(module, prefix).items():
+            self._loadItem(objectName, obj)
 
-        for objectName, obj in getattr(module, self.attr).items():
+    def _loadItem(self, name: str, obj: Any):
+        """
+        Adds the item of a single object, unless it is in itemsHide, and stars or trashes it if it is in itemsStar or
+        itemsTrash.
+        """
+        if name not in self.itemsHide:
             # addItem only requires fullName, everything else is going to be passed as args and kwargs to the item
             # constructor
-            if prefix is not None:
-                objectName = '.'.join([prefix, objectName])
-            if objectName not in self.itemsHide:
-                item = self.addItem(fullName=objectName, star=False, trash=False, element=obj)
-                if objectName in self.itemsTrash:
-                    self.onItemTrashToggle(item)
-                if objectName in self.itemsStar:
-                    self.onItemStarToggle(item)
-
-        for submodName, submod in module.submodules.items():
-            if prefix is not None:
-                submodName = '.'.join([prefix, submodName])
-            self.loadItems(submod, submodName)
+            item = self.addItem(fullName=name, star=False, trash=False, element=obj)
+            if name in self.itemsTrash:
+                self.onItemTrashToggle(item)
+            if name in self.itemsStar:
+                self.onItemStarToggle(item)
 
-    def refreshAll(self):
+    def objectsFromModule(self, module=None, prefix=None) -> Dict[str, Any]:
         """
-        Removes all the rows from the model, updates the instrument and loads the model again.
+        Collects the objects of the attribute we are displaying from a module and all of its submodules.
+
+        :param module: The module we want the objects from. If `None`, self.instrument will be used.
+        :param prefix: any submodule name that should be added before the name of an object.
+        :returns: A dictionary with the full names of the objects as keys and the objects as values.
         """
-        self.removeRows(0, self.rowCount())
-        self.instrument.update()
-        self.loadItems()
+        if module is None:
+            module = self.instrument
+
+        # Single pass over the module tree filling one dictionary, instead of merging the dictionary of every submodule
+        # into its parent's.
+        objects = {}
+        modules = [(module, prefix)]
+        with self.instrumentLock:
+            while len(modules) > 0:
+                module, prefix = modules.pop()
+                namePrefix = '' if prefix is None else prefix + '.'
+                for objectName, obj in getattr(module, self.attr).items():
+                    objects[namePrefix + objectName] = obj
+                for submodName, submod in reversed(list(module.submodules.items())):
+                    modules.append((submod, namePrefix + submodName))
+
+        return objects
+
+    def itemsByName(self) -> Dict[str, ItemBase]:
+        """
+        Returns all the items in the model (submodule items included) with their names as keys.
+        """
+        return dict(self._itemsByName)
+
+    def itemByName(self, name: str) -> Optional[ItemBase]:
+        """
+        Returns the item with the full name `name`, `None` if the model does not have it.
+        """
+        return self._itemsByName.get(name)
+
+    def refreshAll(self, objects: Optional[Dict[str, Any]] = None):
+        """
+        Updates the instrument and synchronizes the model with it. Items whose objects are still present in the
+        instrument are kept (together with their star/trash state and delegates), items whose objects disappeared are
+        removed and only the new objects get added, starred or trashed like in `loadItems`.
+
+        :param objects: The objects of the already updated instrument, as returned by `objectsFromModule`. If `None`,
+            the instrument gets updated and the objects collected here.
+        """
+        if objects is None:
+            with self.instrumentLock:
+                self.instrument.update()
+                objects = self.objectsFromModule()
+
+        # Fast paths for the common trivial cases: an instrument without objects or a model that is still empty
+        # do not need the item walks.
+        if len(objects) == 0:
+            # The index is cleared first, like removeItem does, so anything reacting to the removal sees the items gone.
+            self._itemsByName.clear()
+            self.removeRows(0, self.rowCount())
+        elif self.rowCount() > 0:
+            for name, item in self.itemsByName().items():
+                # Items without element are submodules, they get removed together with their last child.
+                if item.element is None:
+                    continue
+                if name not in objects:
+                    self.removeItem(name)
+                # Updating an instrument might give new objects for the same ones, the item is kept.
+                elif objects[name] is not item.element:
+                    item.element = objects[name]
+
+        for name, obj in objects.items():
+            if name not in self._itemsByName:
+                self._loadItem(name, obj)
+
         self.modelRefreshed.emit()
 
     def insertItemTo(self, parent, item):
@@ -254,10 +397,7 @@ class InstrumentModelBase(QtGui.QStandardItemModel):
 
         If you are using delegates, this function should emit the newItem signal
         """
-        if parent == self:
-            self.setItem(self.rowCount(), 0, item)
-        else:
-            parent.appendRow(item)
+        parent.appendRow(item)
 
     def addItem(self, fullName, **kwargs):
         """
@@ -265,20 +405,15 @@ class InstrumentModelBase(QtGui.QStandardItemModel):
 
         :param fullName: The name of the parameter
         """
-        path = fullName.split('.')[:-1]
-        paramName = fullName.split('.')[-1]
+        parts = fullName.split('.')
 
-        parent = self
-        smName = None
-        for sm in path:
-            if smName is None:
-                smName = sm
-            else:
-                smName = smName + f".{sm}"
+        # Top-level rows live under the invisible root item, so parent is always a QStandardItem.
+        parent = self.invisibleRootItem()
+        for i in range(1, len(parts)):
+            smName = '.'.join(parts[:i])
+            smItem = self._itemsByName.get(smName)
 
-            items = self.findItems(smName, QtCore.Qt.MatchExactly | QtCore.Qt.MatchRecursive, 0)
-
-            if len(items) == 0:
+            if smItem is None:
                 subModItem = self.itemClass(name=smName, star=False, trash=False, showDelegate=False, element=None)
                 # submodules get directly added here and not in the load function, so need to have it here too.
                 if self.loadingItems:
@@ -290,27 +425,46 @@ class InstrumentModelBase(QtGui.QStandardItemModel):
                             self.onItemStarToggle(subModItem)
                 else:
                     self.insertItemTo(parent, subModItem)
+                self._itemsByName[smName] = subModItem
                 parent = subModItem
             else:
-                parent = items[0]
+                parent = smItem
 
         newItem = self.itemClass(name=fullName, **kwargs)
         self.insertItemTo(parent, newItem)
+        self._itemsByName[fullName] = newItem
 
         return newItem
 
     def removeItem(self, fullName):
-        items = self.findItems(fullName, QtCore.Qt.MatchExactly | QtCore.Qt.MatchRecursive, 0)
+        """
+        Removes the item from the model. Submodule items left empty by the removal are removed as well.
 
-        if len(items) > 0:
-            item = items[0]
-            parent = item.parent()
-            if isinstance(parent, self.itemClass):
+        :param fullName: The name of the item.
+        """
+        item = self._itemsByName.get(fullName)
+
+        if item is not None:
+            root = self.invisibleRootItem()
+            parent = item.parent() or root
+            # Only the containers on the path of the removed item can become empty, walk up from it.
+            while True:
+                self._forgetItem(item)
                 parent.removeRow(item.row())
-                if parent.rowCount() == 0:
-                    self.removeItem(parent.name)
-            else:
-                self.removeRow(item.row())
+                if parent is root or parent.rowCount() > 0:
+                    return
+                item = parent
+                parent = item.parent() or root
+
+    def _forgetItem(self, item: ItemBase):
+        """
+        Drops `item` and all of its children from the name index.
+        """
+        items = [item]
+        while len(items) > 0:
+            item = items.pop()
+            self._itemsByName.pop(item.name, None)
+            items += [item.child(i, 0) for i in range(item.rowCount())]
 
     @QtCore.Slot(ItemBase)
     def onItemStarToggle(self, item):
@@ -321,7 +475,7 @@ class InstrumentModelBase(QtGui.QStandardItemModel):
         else:
             item.star = True
             item.trash = False
-            item.setIcon(QtGui.QIcon(':/icons/star.svg'))
+            item.setIcon(getIcon(':/icons/star.svg'))
 
     @QtCore.Slot(ItemBase)
     def onItemTrashToggle(self, item):
@@ -332,7 +486,36 @@ class InstrumentModelBase(QtGui.QStandardItemModel):
         else:
             item.trash = True
             item.star = False
-            item.setIcon(QtGui.QIcon(':/icons/trash.svg'))
+            item.setIcon(getIcon(':/icons/trash.svg'))
+
+
+class _RefreshSignals(QtCore.QObject):
+    #: Signal(object) --
+    #:  emitted with the objects of the updated instrument (see `InstrumentModelBase.objectsFromModule`).
+    objectsReady = QtCore.Signal(object)
+
+
+class _RefreshRunnable(QtCore.QRunnable):
+    """Updates the instrument of a model and collects its objects outside of the GUI thread.
+
+    :param model: The model whose instrument gets updated.
+    """
+
+    def __init__(self, model: InstrumentModelBase):
+        super().__init__()
+        self.model = model
+        self.signals = _RefreshSignals()
+
+    def run(self):
+        try:
+            # The GUI thread (and other refreshes) use the instrument too, it only gets changed while holding its lock.
+            with self.model.instrumentLock:
+                self.model.instrument.update()
+                objects = self.model.objectsFromModule()
+        except Exception as e:
+            logger.error(f"Refreshing {self.model.instrument.name} failed. {type(e)}: {e.args}")
+            return
+        self.signals.objectsReady.emit(objects)
 
 
 class InstrumentSortFilterProxyModel(QtCore.QSortFilterProxyModel):
@@ -354,6 +537,7 @@ class InstrumentSortFilterProxyModel(QtCore.QSortFilterProxyModel):
 
         self.star = False
         self.trash = False
+        self.filterText = ''
 
         self.sort(0, QtCore.Qt.DescendingOrder)
 
@@ -386,8 +570,16 @@ class InstrumentSortFilterProxyModel(QtCore.QSortFilterProxyModel):
 
     @QtCore.Slot(str)
     def onTextFilterChange(self, filter: str):
+        if filter == self.filterRegExp().pattern():
+            return
+
+        self.filterText = filter
         self.filterIncoming.emit()
-        self.setFilterRegExp(filter)
+        # Plain text (the usual case) does not need the regular expression engine, a substring match is enough.
+        if re.escape(filter) == filter:
+            self.setFilterFixedString(filter)
+        else:
+            self.setFilterRegExp(filter)
         self.filterFinished.emit()
 
     def triggerFiltering(self):
@@ -411,18 +603,22 @@ class InstrumentSortFilterProxyModel(QtCore.QSortFilterProxyModel):
         """
         Calls for the super() unless trash is active and the item or one of its parent is trash.
         """
-        parent = self.sourceModel().itemFromIndex(source_parent)
-        if parent is None:
-            item = self.sourceModel().item(source_row, 0)
-        else:
-            item = parent.child(source_row, 0)
-
         # The order in which things get constructed seems to impact this.
         # When the application is first starting, the  proxy model does not have the trash attribute.
-        if hasattr(self, 'trash'):
-            if self.trash:
-                if self._isParentTrash(parent) or item.trash:
-                    return False
+        # This gets called for every row on every filter change, only look up the items when trash is active.
+        if getattr(self, 'trash', False):
+            parent = self.sourceModel().itemFromIndex(source_parent)
+            if parent is None:
+                item = self.sourceModel().item(source_row, 0)
+            else:
+                item = parent.child(source_row, 0)
+
+            if self._isParentTrash(parent) or item.trash:
+                return False
+
+        # Without filter text every row is accepted, no need to go through the base implementation.
+        if not getattr(self, 'filterText', ''):
+            return True
 
         return super().filterAcceptsRow(source_row, source_parent)
 
@@ -474,6 +670,12 @@ class InstrumentTreeViewBase(QtWidgets.QTreeView):
         # indicating its collapsed state
         self.collapsedState: Dict[QtCore.QPersistentModelIndex, bool] = {}
         self.collapsedStateDebug: Dict[str, bool] = {}
+        # While the model is being refreshed new rows do not get their delegates one by one, the model emits
+        # modelRefreshed at the end, which opens the delegates of all visible rows at once.
+        self.delegateChecksSuspended = False
+        # Set while the whole tree gets expanded or collapsed. Depending on the Qt version that emits expanded/collapsed
+        # for every single index or not at all, the delegates get handled in a single walk at the end instead.
+        self._bulkExpanding = False
 
         self.setModel(model)
 
@@ -489,11 +691,14 @@ class InstrumentTreeViewBase(QtWidgets.QTreeView):
         self.header().setSectionsClickable(True)
 
         self.setAlternatingRowColors(True)
+        # The delegates give every row the height of their editors (see DelegateBase), so the view does not need to
+        # ask for the height of every single row when laying out.
+        self.setUniformRowHeights(True)
 
-        self.starIcon = QtGui.QIcon(':/icons/star.svg')
-        self.starCrossedIcon = QtGui.QIcon(':/icons/star-crossed.svg')
-        self.trashIcon = QtGui.QIcon(':/icons/trash.svg')
-        self.trashCrossedIcon = QtGui.QIcon(':/icons/trash-crossed')
+        self.starIcon = getIcon(':/icons/star.svg')
+        self.starCrossedIcon = getIcon(':/icons/star-crossed.svg')
+        self.trashIcon = getIcon(':/icons/trash.svg')
+        self.trashCrossedIcon = getIcon(':/icons/trash-crossed')
 
         self.starItemAction = QtWidgets.QAction(self.starIcon, 'Star Item')
         self.starItemAction.triggered.connect(self.onStarActionTrigger)
@@ -507,31 +712,30 @@ class InstrumentTreeViewBase(QtWidgets.QTreeView):
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.onContextMenuRequested)
 
+        self.expanded.connect(self.onExpanded)
+        self.collapsed.connect(self.onCollapsed)
+
     @QtCore.Slot()
     def fillCollapsedDict(self, parentItem: Optional[ItemBase]=None):
         """
         Fills the collapsed state dictionary to be recovered after a filter event occured.
+        Only items with children can be expanded, so those are the only ones stored.
         """
         if parentItem is None:
-            for i in range(self.modelActual.rowCount()):
-                index = self.modelActual.index(i, 0)
-                item = self.modelActual.itemFromIndex(index)
-                persistentIndex = QtCore.QPersistentModelIndex(index)
-                proxyIndex = self.model().mapFromSource(index)
-                if proxyIndex.isValid():
-                    self.collapsedState[persistentIndex] = self.isExpanded(proxyIndex)
-                    if item.hasChildren():
-                        self.fillCollapsedDict(item)
-        else:
-            for i in range(parentItem.rowCount()):
-                child = parentItem.child(i, 0)
+            # Rows get hidden and shown one by one while filtering, the view gets repainted once restoreCollapsedDict
+            # is done instead. The selection does not need to follow every single change either.
+            self.setUpdatesEnabled(False)
+            self.selectionModel().blockSignals(True)
+            parentItem = self.modelActual.invisibleRootItem()
+
+        for i in range(parentItem.rowCount()):
+            child = parentItem.child(i, 0)
+            if child.hasChildren():
                 childIndex = self.modelActual.indexFromItem(child)
-                persistentIndex = QtCore.QPersistentModelIndex(childIndex)
                 proxyIndex = self.model().mapFromSource(childIndex)
                 if proxyIndex.isValid():
-                    self.collapsedState[persistentIndex] = self.isExpanded(proxyIndex)
-                    if child.hasChildren():
-                        self.fillCollapsedDict(child)
+                    self.collapsedState[QtCore.QPersistentModelIndex(childIndex)] = self.isExpanded(proxyIndex)
+                    self.fillCollapsedDict(child)
 
     @QtCore.Slot()
     def restoreCollapsedDict(self):
@@ -541,65 +745,124 @@ class InstrumentTreeViewBase(QtWidgets.QTreeView):
         """
         for persistentIndex, state in self.collapsedState.items():
             modelIndex = self.modelActual.index(persistentIndex.row(), persistentIndex.column(), persistentIndex.parent())
-            item = self.modelActual.itemFromIndex(modelIndex)
             proxyIndex = self.model().mapFromSource(modelIndex)
             self.setExpanded(proxyIndex, state)
-            if item.showDelegate:
-                delegateIndexes = [self.modelActual.index(persistentIndex.row(), x, persistentIndex.parent()) for x in
-                                   self.delegateColumns]
-                proxyDelegateIndexes = [self.model().mapFromSource(index) for index in delegateIndexes]
-                for delegateIndex in proxyDelegateIndexes:
-                    self.openPersistentEditor(delegateIndex)
+        self.setAllDelegatesPersistent()
         self.scheduleDelayedItemsLayout()
+        self.selectionModel().blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.viewport().update()
 
     def setAllDelegatesPersistent(self, parentIndex=None):
         """
-        Recursive function that goes through the entire model and sets all delegates to be persistent editors
+        Recursive function that goes through the model and sets the delegates of all the visible rows to be persistent
+        editors. Children of collapsed items are skipped, their delegates get created once the item is expanded.
 
-        :param parentIndex: If None, start the process. if it's an item, it will go through the children
+        :param parentIndex: If None, start the process. if it's an index of the proxy model, it will go through
+            its children.
         """
         if parentIndex is None:
-            for i in range(self.model().rowCount()):
-                for column in self.delegateColumns:
-                    index = self.model().index(i, column)
-                    index0 = self.model().index(i, 0)  # Only items at column 0 hold children and model info
-                    item0 = self.modelActual.itemFromIndex(self.model().mapToSource(index0))
-                    if item0.showDelegate:
-                        self.openPersistentEditor(index)
-                    if item0.hasChildren():
-                        self.setAllDelegatesPersistent(index0)
+            parentIndex = QtCore.QModelIndex()
 
-        else:
-            parentItem = self.modelActual.itemFromIndex(self.model().mapToSource(parentIndex))
-            for i in range(parentItem.rowCount()):
+        model = self.model()
+        for i in range(model.rowCount(parentIndex)):
+            index0 = model.index(i, 0, parentIndex)  # Only items at column 0 hold children and model info
+            item0 = self.modelActual.itemFromIndex(model.mapToSource(index0))
+            if item0.showDelegate:
                 for column in self.delegateColumns:
-                    item = parentItem.child(i, column)
-                    item0 = parentItem.child(i, 0)
-                    index = self.model().mapFromSource(self.modelActual.indexFromItem(item))
-                    index0 = self.model().mapFromSource(self.modelActual.indexFromItem(item0))
-                    if item0.showDelegate:
-                        self.openPersistentEditor(index)
-                    if item0.hasChildren():
-                        self.setAllDelegatesPersistent(index0)
+                    self.openDelegate(model.index(i, column, parentIndex))
+            if item0.hasChildren() and self.isExpanded(index0):
+                self.setAllDelegatesPersistent(index0)
+
+    def openDelegate(self, index: QtCore.QModelIndex):
+        """
+        Opens the persistent editor of `index` unless it already has one. Opening an editor that is already open
+        does not create a new widget, but it still goes through the layout of the view for the row.
+
+        :param index: index of the proxy model.
+        """
+        if not self.isPersistentEditorOpen(index):
+            self.openPersistentEditor(index)
+
+    def closeDelegates(self, parentIndex):
+        """
+        Recursive function that closes the persistent editors of all the children of parentIndex.
+
+        :param parentIndex: index of the proxy model whose children's delegates get closed.
+        """
+        model = self.model()
+        for i in range(model.rowCount(parentIndex)):
+            for column in self.delegateColumns:
+                self.closePersistentEditor(model.index(i, column, parentIndex))
+            index0 = model.index(i, 0, parentIndex)
+            if model.hasChildren(index0):
+                self.closeDelegates(index0)
+
+    @QtCore.Slot(QtCore.QModelIndex)
+    def onExpanded(self, index):
+        """
+        Creates the delegates of the children of an item when it gets expanded.
+        """
+        if self._bulkExpanding:
+            return
+        self.setAllDelegatesPersistent(index)
+        self.scheduleDelayedItemsLayout()
+
+    @QtCore.Slot(QtCore.QModelIndex)
+    def onCollapsed(self, index):
+        """
+        Closes the delegates of the children of an item when it gets collapsed, they are not visible anymore.
+        """
+        if self._bulkExpanding:
+            return
+        self.closeDelegates(index)
+
+    @QtCore.Slot()
+    def expandAll(self):
+        self._bulkExpanding = True
+        try:
+            super().expandAll()
+        finally:
+            self._bulkExpanding = False
+        self.setAllDelegatesPersistent()
+        self.scheduleDelayedItemsLayout()
+
+    @QtCore.Slot()
+    def collapseAll(self):
+        self._bulkExpanding = True
+        try:
+            super().collapseAll()
+        finally:
+            self._bulkExpanding = False
+        model = self.model()
+        for i in range(model.rowCount()):
+            self.closeDelegates(model.index(i, 0))
 
     @QtCore.Slot(object)
     def onCheckDelegate(self, item):
         """
-        Makes sure that the delegates are shown if needed.
+        Makes sure that the delegates are shown if needed. Items inside a collapsed item get their delegates once
+        the parent gets expanded.
 
         :param item: The item whose row the delegates need to be activated
         """
+        if self.delegateChecksSuspended:
+            return
         if item is not None:
             if item.showDelegate:
                 row = item.row()
                 parent = item.parent()
+                if parent is not None:
+                    parentIndex = self.model().mapFromSource(self.modelActual.indexFromItem(parent))
+                    if not self.isExpanded(parentIndex):
+                        return
                 for column in self.delegateColumns:
                     if parent is None:
                         sibling = self.modelActual.item(row, column)
                     else:
                         sibling = parent.child(row, column)
                     index = self.model().mapFromSource(self.modelActual.indexFromItem(sibling))
-                    self.openPersistentEditor(index)
+                    self.openDelegate(index)
             self.scheduleDelayedItemsLayout()
 
     @QtCore.Slot(QtCore.QPoint)
@@ -697,6 +960,19 @@ class InstrumentDisplayBase(QtWidgets.QWidget):
 
         self.view.expandAll()
 
+        # Refresh requests are coalesced: several requests during the same turn of the event loop result in
+        # a single refresh.
+        self._refreshTimer = QtCore.QTimer(self)
+        self._refreshTimer.setSingleShot(True)
+        self._refreshTimer.setInterval(0)
+        self._refreshTimer.timeout.connect(self._performRefresh)
+
+        # The filter only gets applied once the user stops typing for a moment, not on every keystroke.
+        self._filterTimer = QtCore.QTimer(self)
+        self._filterTimer.setSingleShot(True)
+        self._filterTimer.setInterval(150)
+        self._filterTimer.timeout.connect(self._applyFilter)
+
         if callSignals:
             self.connectSignals()
 
@@ -713,7 +989,9 @@ class InstrumentDisplayBase(QtWidgets.QWidget):
         self.view.itemStarToggle.connect(self.model.onItemStarToggle)
         self.view.itemTrashToggle.connect(self.model.onItemTrashToggle)
 
-        self.lineEdit.textChanged.connect(self.proxyModel.onTextFilterChange)
+        self.lineEdit.textChanged.connect(lambda x: self._filterTimer.start())
+        # Pressing enter or leaving the filter (both emit editingFinished) does not wait for the timer.
+        self.lineEdit.editingFinished.connect(self._applyFilter)
 
         self.view.header().sortIndicatorChanged.connect(self.proxyModel.onSortingIndicatorChanged)
 
@@ -725,40 +1003,40 @@ class InstrumentDisplayBase(QtWidgets.QWidget):
         toolbar.setIconSize(QtCore.QSize(16, 16))
 
         refreshAction = toolbar.addAction(
-            QtGui.QIcon(":/icons/refresh.svg"),
+            getIcon(":/icons/refresh.svg"),
             "refresh all items from the instrument",
         )
-        refreshAction.triggered.connect(lambda x: self.refreshAll())
+        refreshAction.triggered.connect(self.refreshAll)
 
         toolbar.addSeparator()
 
         expandAction = toolbar.addAction(
-            QtGui.QIcon(":/icons/expand.svg"),
+            getIcon(":/icons/expand.svg"),
             "expand tree",
         )
-        expandAction.triggered.connect(lambda x: self.view.expandAll())
+        expandAction.triggered.connect(self.view.expandAll)
 
         collapseAction = toolbar.addAction(
-            QtGui.QIcon(":/icons/collapse.svg"),
+            getIcon(":/icons/collapse.svg"),
             "collapse tree",
         )
-        collapseAction.triggered.connect(lambda x: self.view.collapseAll())
+        collapseAction.triggered.connect(self.view.collapseAll)
 
         toolbar.addSeparator()
 
         starAction = toolbar.addAction(
-            QtGui.QIcon(':/icons/star.svg'),
+            getIcon(':/icons/star.svg'),
             "Move Starred items to the top"
         )
         starAction.setCheckable(True)
-        starAction.triggered.connect(lambda x: self.promoteStar())
+        starAction.triggered.connect(self.promoteStar)
 
         trashAction = toolbar.addAction(
-            QtGui.QIcon(":/icons/trash-crossed.svg"),
+            getIcon(":/icons/trash-crossed.svg"),
             "Hide trashed items"
         )
         trashAction.setCheckable(True)
-        trashAction.triggered.connect(lambda x: self.hideTrash())
+        trashAction.triggered.connect(self.hideTrash)
 
         # Debugging tools keep commented for commits.
         # printAction = toolbar.addAction(
@@ -779,9 +1057,45 @@ class InstrumentDisplayBase(QtWidgets.QWidget):
     def promoteStar(self):
         self.proxyModel.onToggleStar()
 
+    @QtCore.Slot()
+    def _applyFilter(self):
+        self._filterTimer.stop()
+        self.proxyModel.onTextFilterChange(self.lineEdit.text())
+
     @QtCore.Slot()
     def refreshAll(self):
-        self.model.refreshAll()
+        """
+        Schedules a refresh of the model. The refresh happens once control returns to the event loop.
+        """
+        self._refreshTimer.start()
+
+    @QtCore.Slot()
+    def _performRefresh(self):
+        # Updating the instrument can mean several calls to the server, that happens in the global thread pool.
+        # Only the changes to the model are done in the GUI thread.
+        runnable = _RefreshRunnable(self.model)
+        runnable.signals.objectsReady.connect(self._applyRefresh)
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
+    @QtCore.Slot(object)
+    def _applyRefresh(self, objects: Dict[str, Any]):
+        # Rows get added and removed one by one while refreshing, the selection does not need to follow every single
+        # change. The view gets repainted once at the end instead.
+        # The proxy model would also sort again after every single insertion, it sorts once at the end instead.
+        selectionModel = self.view.selectionModel()
+        selectionModel.blockSignals(True)
+        self.view.setUpdatesEnabled(False)
+        self.proxyModel.setDynamicSortFilter(False)
+        self.view.delegateChecksSuspended = True
+        try:
+            self.model.refreshAll(objects)
+        finally:
+            self.view.delegateChecksSuspended = False
+            # Turning dynamic sorting back on sorts the proxy model.
+            self.proxyModel.setDynamicSortFilter(True)
+            selectionModel.blockSignals(False)
+            self.view.setUpdatesEnabled(True)
+        self.view.viewport().update()
 
     def debuggingMethod(self):
         """
@@ -1,18 +1,24 @@
 import json
 import logging
 import inspect
+import re
+import reprlib
+import threading
+from collections import OrderedDict
+from functools import partial
 from pprint import pprint
 from typing import Optional, Any, List, Tuple, Union, Callable, Dict, Type
 
 from instrumentserver.gui.misc import AlertLabelGreen
 from qcodes import Parameter, Instrument
 
-from . import parameters, keepSmallHorizontally
-from .base_instrument import InstrumentDisplayBase, ItemBase, InstrumentModelBase, InstrumentTreeViewBase, DelegateBase
+from . import parameters, keepSmallHorizontally, getIcon, setStyleProperty
+from .base_instrument import InstrumentDisplayBase, ItemBase, InstrumentModelBase, InstrumentTreeViewBase, DelegateBase, \
+    instrumentLock
 from .parameters import ParameterWidget, AnyInput, AnyInputForMethod
 from .. import QtWidgets, QtCore, QtGui
 from ..blueprints import ParameterBroadcastBluePrint
-from ..client import ProxyInstrument, SubClient
+from ..client import ProxyInstrument, SubClient, startSubClient
 from ..helpers import stringToArgsAndKwargs, nestedAttributeFromString
 from ..params import ParameterManager, paramTypeFromName, ParameterTypes, parameterTypes
 from ..serialize import toParamDict
@@ -24,6 +30,53 @@ from ast import literal_eval
 logger = logging.getLogger(__name__)
 
 
+def _parseBool(value: str) -> bool:
+    return value.strip().lower() in ('true', '1', 'yes')
+
+
+#: Plain integer and float literals, the most common values. Python's rules are followed (no leading zeros
+#: for integers, no surrounding spaces) so these give the same result as ``literal_eval``.
+_INT_LITERAL = re.compile(r'[+-]?(?:0|[1-9][0-9]*)')
+_FLOAT_LITERAL = re.compile(r'[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+(?=[eE]))(?:[eE][+-]?[0-9]+)?')
+
+
+def _parseAny(value: str) -> Any:
+    # Numbers don't need to go through the parser.
+    if _INT_LITERAL.fullmatch(value):
+        return int(value)
+    if _FLOAT_LITERAL.fullmatch(value):
+        return float(value)
+    try:
+        return literal_eval(value)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return value
+
+
+#: Parsers used to convert the value string of a new parameter depending on the parameter type.
+#: Types without an entry are parsed with :func:`_parseAny`.
+valueParsers: Dict[ParameterTypes, Callable[[str], Any]] = {
+    ParameterTypes.numeric: float,
+    ParameterTypes.integer: int,
+    ParameterTypes.complex: complex,
+    ParameterTypes.bool: _parseBool,
+    ParameterTypes.string: str,
+}
+
+
+#: Names of all parameter types, in the order they are shown in the type selection.
+_SORTED_TYPE_NAMES = sorted(v['name'] for v in parameterTypes.values())
+#: Index of the type selected by default (numeric) in the type selection.
+_DEFAULT_TYPE_INDEX = _SORTED_TYPE_NAMES.index(parameterTypes[ParameterTypes.numeric]['name'])
+
+
+def parseParameterValue(value: str, ptype: ParameterTypes = ParameterTypes.any) -> Any:
+    """Convert the string representation of a value into the type given by ``ptype``.
+
+    :raises: ``ValueError`` if the value cannot be interpreted as ``ptype``.
+    """
+    return valueParsers.get(ptype, _parseAny)(value)
+
+
 class AddParameterWidget(QtWidgets.QWidget):
     """A widget that allows parameter creation.
 
@@ -67,12 +120,8 @@ class AddParameterWidget(QtWidgets.QWidget):
 
         if typeInput:
             self.typeSelect = QtWidgets.QComboBox(self)
-            names = []
-            for t, v in parameterTypes.items():
-                names.append(v['name'])
-            for n in sorted(names):
-                self.typeSelect.addItem(n)
-            self.typeSelect.setCurrentText(parameterTypes[ParameterTypes.numeric]['name'])
+            self.typeSelect.addItems(_SORTED_TYPE_NAMES)
+            self.typeSelect.setCurrentIndex(_DEFAULT_TYPE_INDEX)
             lbl = QtWidgets.QLabel("Type:")
             lbl.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
             layout.addWidget(lbl, 1, 0)
@@ -91,19 +140,19 @@ class AddParameterWidget(QtWidgets.QWidget):
             layout.addWidget(self.valsArgsEdit, 1, 3)
 
         self.addButton = QtWidgets.QPushButton(
-            QtGui.QIcon(":/icons/plus-square.svg"),
+            getIcon(":/icons/plus-square.svg"),
             ' Add',
             parent=self)
 
         self.addButton.clicked.connect(self.requestNewParameter)
-        self.nameEdit.returnPressed.connect(self.addButton.click)
-        self.valueEdit.returnPressed.connect(self.addButton.click)
-        self.unitEdit.returnPressed.connect(self.addButton.click)
+        # Enter requests the parameter directly, clicking the button would also animate it.
+        for edit in (self.nameEdit, self.valueEdit, self.unitEdit):
+            edit.returnPressed.connect(self._submit)
         layout.addWidget(self.addButton, 0, 6, 1, 1)
         self.addButton.setAutoDefault(True)
 
         self.clearButton = QtWidgets.QPushButton(
-            QtGui.QIcon(":/icons/delete.svg"),
+            getIcon(":/icons/delete.svg"),
             ' Clear',
             parent=self)
 
@@ -114,6 +163,40 @@ class AddParameterWidget(QtWidgets.QWidget):
         self.setLayout(layout)
         self.invalidParamRequested.connect(self.setError)
 
+        # Errors only toggle a property of the add button, the style sheet gets parsed once here.
+        self.setStyleSheet("""
+        QPushButton[error="true"] { background-color: red }
+        """)
+
+        #: Optional function that checks a name while it is typed. Gets the name and returns an error message,
+        #: or ``None`` if the name can be used.
+        self.nameValidator: Optional[Callable[[str], Optional[str]]] = None
+
+        # The name gets checked once the user stops typing for a moment, not on every keystroke.
+        self._nameTimer = QtCore.QTimer(self)
+        self._nameTimer.setSingleShot(True)
+        self._nameTimer.setInterval(200)
+        self._nameTimer.timeout.connect(self.validateName)
+        self.nameEdit.textChanged.connect(lambda x: self._nameTimer.start())
+
+    @QtCore.Slot()
+    def _submit(self):
+        self.requestNewParameter(False)
+
+    @QtCore.Slot()
+    def validateName(self):
+        """Shows an error on the add button if the typed name cannot be used. Empty names are not flagged while
+        typing, they only are when the parameter is requested."""
+        name = self.nameEdit.text().strip()
+        error = None
+        if len(name) > 0 and self.nameValidator is not None:
+            error = self.nameValidator(name)
+
+        if error is None:
+            self.clearError()
+        else:
+            self.setError(error)
+
     @QtCore.Slot()
     def clear(self):
         self.clearError()
@@ -121,7 +204,7 @@ class AddParameterWidget(QtWidgets.QWidget):
         self.valueEdit.setText('')
         self.unitEdit.setText('')
         if self.typeInput:
-            self.typeSelect.setCurrentText(parameterTypes[ParameterTypes.numeric]['name'])
+            self.typeSelect.setCurrentIndex(_DEFAULT_TYPE_INDEX)
             self.valsArgsEdit.setText('')
 
     @QtCore.Slot(bool)
@@ -146,16 +229,33 @@ class AddParameterWidget(QtWidgets.QWidget):
 
     @QtCore.Slot(str)
     def setError(self, message: str):
-        self.addButton.setStyleSheet("""
-        QPushButton { background-color: red }
-        """)
+        setStyleProperty(self.addButton, 'error', True)
         self.addButton.setToolTip(message)
 
+    @QtCore.Slot()
     def clearError(self):
-        self.addButton.setStyleSheet("")
+        setStyleProperty(self.addButton, 'error', False)
         self.addButton.setToolTip("")
 
 
+_returnValueRepr = reprlib.Repr()
+_returnValueRepr.maxstring = 200
+_returnValueRepr.maxother = 200
+_returnValueRepr.maxlist = _returnValueRepr.maxtuple = _returnValueRepr.maxdict = 20
+
+
+def _shortRepr(value: Any) -> str:
+    """Returns a representation of `value` that is short enough for a tooltip or a log line."""
+    if isinstance(value, str):
+        return value if len(value) <= _returnValueRepr.maxstring else value[:_returnValueRepr.maxstring] + '...'
+    return _returnValueRepr.repr(value)
+
+
+def _signatureAndDoc(fun: Callable) -> Tuple[str, str]:
+    """Returns the signature and the documentation of `fun` as strings."""
+    return str(inspect.signature(fun)), str(inspect.getdoc(fun))
+
+
 class MethodDisplay(QtWidgets.QWidget):
     #: Signal(str)
     #: emitted when the widget runs a function and fails. Emits the exception as a string.
@@ -165,7 +265,7 @@ class MethodDisplay(QtWidgets.QWidget):
     #: emitted when the widget runs a function and is successful. Emits the return value as a string.
     runSuccessful = QtCore.Signal(str)
 
-    def __init__(self, fun, fullName=None, *args, **kwargs):
+    def __init__(self, fun, fullName=None, *args, signatureAndDoc: Optional[Tuple[str, str]] = None, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.fun = fun
@@ -174,8 +274,9 @@ class MethodDisplay(QtWidgets.QWidget):
         self.fullName = fullName
 
         self.anyInput = AnyInputForMethod()
-        self.anyInput.input.setPlaceholderText(str(inspect.signature(fun)))
-        self.anyInput.input.setToolTip(self.getTooltipFromFun(fun))
+        sig, doc = _signatureAndDoc(fun) if signatureAndDoc is None else signatureAndDoc
+        self.anyInput.input.setPlaceholderText(sig)
+        self.anyInput.input.setToolTip(sig + '\n\n' + doc)
         self.anyInput.input.returnPressed.connect(self.runFun)
 
         self.runButton = QtWidgets.QPushButton("Run", parent=self)
@@ -200,12 +301,14 @@ class MethodDisplay(QtWidgets.QWidget):
             if kwargs is not None:
                 ret = self.fun(*args, **kwargs)
             else:
-                if isinstance(args, list) or isinstance(args, tuple) or args != '':
+                if isinstance(args, (list, tuple)) or args != '':
                     ret = self.fun(*args)
                 else:
                     ret = self.fun()
-            self.runSuccessful.emit(str(ret))
-            logger.info(f"'{self.fullName}' returned: {ret}")
+            # Return values can be large (arrays, long lists), only a short representation gets shown and logged.
+            msg = _shortRepr(ret)
+            self.runSuccessful.emit(msg)
+            logger.info("'%s' returned: %s", self.fullName, msg)
 
         except Exception as e:
             self.runFailed.emit(str(e))
@@ -216,9 +319,8 @@ class MethodDisplay(QtWidgets.QWidget):
         """
         Returns the signature of the function with its documentation underneath.
         """
-        sig = inspect.signature(fun)
-        doc = inspect.getdoc(fun)
-        return str(sig) + '\n\n' + str(doc)
+        sig, doc = _signatureAndDoc(fun)
+        return sig + '\n\n' + doc
 
 
 # ----------------- Parameters Display Classes - Beginning -----------------------------
@@ -233,69 +335,290 @@ class ItemParameters(ItemBase):
 class ParameterDelegate(DelegateBase):
     """
     The delegate for the InstrumentParameters widget.
+
+    Widgets of rows that get hidden (collapsed parent, filtered out) are kept and handed back when the row shows up
+    again, creating one means reading the parameter, which is a call to the server for proxy instruments.
     """
 
+    #: Maximum number of widgets of hidden rows that are kept for reuse.
+    maxPooledEditors = 256
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
 
         # Stores as key the name of the item and as value the widget that the delegate creates.
-        # used to keep a reference to the widget.
+        # used to keep a reference to the widget. Pooled widgets stay in here too.
         self.parameters: Dict[str, QtWidgets.QWidget] = {}
 
+        # Widgets of hidden rows by name, oldest first.
+        self._pool: Dict[str, QtWidgets.QWidget] = OrderedDict()
+        # Latest values of pooled widgets by name. Hidden widgets are not updated, they get the last value when reused.
+        self._pendingValues: Dict[str, Any] = {}
+
     def createEditor(self, widget: QtWidgets.QWidget, option: QtWidgets.QStyleOptionViewItem,
                      index: QtCore.QModelIndex) -> QtWidgets.QWidget:
         """
         This is the function that is supposed to create the widget. It should return it.
         """
         item = self.getItem(index)
-        element = item.element
 
-        ret = ParameterWidget(element, widget)
+        ret = self._pool.pop(item.name, None)
+        # The parameter might have been deleted and created again under the same name since the widget was pooled.
+        if ret is not None and ret._parameter is not item.element:
+            self._discardEditor(item.name, ret)
+            ret = None
+        if ret is None:
+            ret = self.makeEditor(item, widget)
+        elif item.name in self._pendingValues:
+            ret.showValue(self._pendingValues.pop(item.name))
+
         self.parameters[item.name] = ret
         return ret
 
+    def makeEditor(self, item: ItemBase, widget: QtWidgets.QWidget) -> QtWidgets.QWidget:
+        """
+        Creates a new widget for `item`.
+        """
+        return ParameterWidget(item.element, widget)
+
+    def sampleEditor(self) -> QtWidgets.QWidget:
+        # A settable parameter gets an input field and all the buttons, the tallest widget a row can have.
+        return self.makeEditor(ItemBase('sample', element=Parameter('sample', set_cmd=None)), None)
+
+    def destroyEditor(self, editor: QtWidgets.QWidget, index: QtCore.QModelIndex) -> None:
+        """
+        Called by the view when the widget of a row is not needed anymore (e.g.: its parent got collapsed).
+        The widget gets pooled instead of deleted, the view already hid it.
+        """
+        if index.isValid():
+            item = self.getItem(index)
+            name = item.name
+            # Widgets of rows that are being removed from the model are not going to be shown again. The model drops
+            # items from its name index before removing their rows.
+            if item.model().itemByName(name) is item and self.parameters.get(name) is editor:
+                self._pool[name] = editor
+                self._pool.move_to_end(name)
+                while len(self._pool) > self.maxPooledEditors:
+                    self._discardEditor(*self._pool.popitem(last=False))
+                return
+
+        self._forgetEditor(self.parameters, editor, index)
+        super().destroyEditor(editor, index)
+
+    def _discardEditor(self, name: str, editor: QtWidgets.QWidget):
+        if self.parameters.get(name) is editor:
+            del self.parameters[name]
+        self._pendingValues.pop(name, None)
+        editor.deleteLater()
+
+    def setValue(self, name: str, value: Any):
+        """
+        Shows a new value of the parameter `name`. Only widgets that are shown get updated right away.
+        """
+        if name in self._pool:
+            self._pendingValues[name] = value
+            return
+
+        # Rows that were never visible do not have a widget, it gets the current value once it is created.
+        widget = self.parameters.get(name)
+        if widget is not None:
+            widget.showValue(value)
+
+
+#: Broadcast actions that carry a new value of an existing parameter.
+_VALUE_ACTIONS = frozenset(['parameter-update', 'parameter-call'])
+
 
 class ModelParameters(InstrumentModelBase):
     # : Signal(item, object) : Emitted when an item in the model has received a new value, first object is the item's
     # name, second object is its new value
     itemNewValue = QtCore.Signal(object, object)
 
+    #: Time in ms broadcasts get collected before being applied. 16 ms matches a 60 Hz display, faster updates
+    #: would not be visible anyway.
+    updateInterval = 16
+
+    #: Time in ms after loading (or stopping the live updates) in which starting the live updates is not expected to
+    #: miss any broadcasts.
+    updateStartGrace = 1000
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.setColumnCount(3)
         self.setHorizontalHeaderLabels([self.attr, 'unit', ''])
 
-        # Live updates items
-        self.cliThread = QtCore.QThread()
+        # Parameter objects by full name, filled on demand by `parameter`.
+        self._parameterCache: Dict[str, Parameter] = {}
+
+        # Live updates items. The subscription only gets started once the parameters are shown,
+        # see startLiveUpdates and stopLiveUpdates.
+        self.subClient: Optional[SubClient] = None
+        # Time since the model was last known to be in sync with the instrument without live updates.
+        self._syncedTimer = QtCore.QElapsedTimer()
+        self._syncedTimer.start()
+
+        # Broadcasts arriving in bursts get collected and applied together, in the order they arrived. Only the last
+        # of several new values in a row for a parameter gets applied, creations and deletions always are.
+        self._pendingUpdates: List[ParameterBroadcastBluePrint] = []
+        # Position in _pendingUpdates of the value broadcast of a parameter that later values replace.
+        self._pendingValueIndex: Dict[str, int] = {}
+        self._flushTimer = QtCore.QTimer(self)
+        self._flushTimer.setSingleShot(True)
+        self._flushTimer.setInterval(self.updateInterval)
+        self._flushTimer.timeout.connect(self.flushUpdates)
+
+    def startLiveUpdates(self) -> bool:
+        """
+        Subscribes to the broadcasts of the instrument, if that did not happen yet. Each subscription uses a socket
+        and a thread of the pool, so models of parameters that are never shown do not subscribe at all.
+
+        :returns: ``True`` if the subscription started now and broadcasts sent since the model got loaded (or the
+            live updates stopped) more than `updateStartGrace` ms ago might have been missed, ``False`` otherwise.
+        """
+        if self.subClient is not None:
+            return False
+
         self.subClient = SubClient([self.instrument.name])
-        self.subClient.moveToThread(self.cliThread)
+        # Broadcasts are emitted from the subscription client's pool thread, they always get queued to the GUI thread.
+        self.subClient.update.connect(self.queueUpdate, QtCore.Qt.QueuedConnection)
+        # The update loop needs to end before the application quits, otherwise the pool waits for it forever.
+        self.destroyed.connect(self.subClient.stop)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.subClient.stop)
+        startSubClient(self.subClient)
+
+        return self._syncedTimer.elapsed() > self.updateStartGrace
+
+    @QtCore.Slot()
+    def stopLiveUpdates(self):
+        """
+        Ends the subscription started by `startLiveUpdates`, freeing its socket and pool thread. Broadcasts already
+        received still get applied.
+        """
+        if self.subClient is None:
+            return
 
-        self.cliThread.started.connect(self.subClient.connect)
-        self.subClient.update.connect(self.updateParameter)
+        subClient, self.subClient = self.subClient, None
+        subClient.stop()
+        subClient.update.disconnect(self.queueUpdate)
+        self.destroyed.disconnect(subClient.stop)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.disconnect(subClient.stop)
+        self._syncedTimer.start()
+
+    @QtCore.Slot(object)
+    def applyValues(self, values: Dict[str, Any]):
+        """
+        Shows values read from the instrument (e.g.: after the live updates were stopped for a while).
 
-        self.cliThread.start()
+        :param values: New values by full parameter name.
+        """
+        for name, value in values.items():
+            if self.itemByName(name) is not None:
+                self.itemNewValue.emit(name, value)
 
     @QtCore.Slot(ParameterBroadcastBluePrint)
-    def updateParameter(self, bp: ParameterBroadcastBluePrint):
-        fullName = '.'.join(bp.name.split('.')[1:])
+    def queueUpdate(self, bp: ParameterBroadcastBluePrint):
+        """
+        Stores the broadcast until the next flush. A new value replaces the pending value of the same parameter,
+        unless the parameter got created or deleted in between: a creation followed by a value still creates the
+        parameter first.
+        """
+        if bp.action in _VALUE_ACTIONS:
+            index = self._pendingValueIndex.get(bp.name)
+            if index is not None:
+                self._pendingUpdates[index] = bp
+                return
+            self._pendingValueIndex[bp.name] = len(self._pendingUpdates)
+        else:
+            self._pendingValueIndex.pop(bp.name, None)
 
-        if bp.action == 'parameter-creation':
-            if fullName not in self.instrument.list():
-                self.instrument.update()
-            if fullName in self.instrument.list():
-                self.addItem(fullName, element=nestedAttributeFromString(self.instrument, fullName))
+        self._pendingUpdates.append(bp)
+        if not self._flushTimer.isActive():
+            self._flushTimer.start()
 
-        elif bp.action == 'parameter-deletion':
-            self.removeItem(fullName)
+    @QtCore.Slot()
+    def flushUpdates(self):
+        pending = self._pendingUpdates
+        self._pendingUpdates = []
+        self._pendingValueIndex.clear()
+
+        # Parameters created in a burst (e.g.: loading a file) would each update the instrument, which is a call to
+        # the server for proxy instruments. One update before applying them covers all of them.
+        with self.instrumentLock:
+            for bp in pending:
+                if bp.action == 'parameter-creation' and self._localParameter(bp.name.partition('.')[2]) is None:
+                    self.instrument.update()
+                    break
+
+        for bp in pending:
+            self.updateParameter(bp)
+
+    def parameter(self, fullName: str) -> Parameter:
+        """
+        Returns the parameter of the instrument with the full name `fullName`. Parameters are cached, so the
+        attribute walk through the (proxy) instrument only happens once per parameter.
+        """
+        param = self._parameterCache.get(fullName)
+        if param is None:
+            # Proxy instruments might update themselves while looking up an attribute they don't have yet.
+            with self.instrumentLock:
+                param = nestedAttributeFromString(self.instrument, fullName)
+            self._parameterCache[fullName] = param
+        return param
+
+    def _localParameter(self, fullName: str) -> Optional[Parameter]:
+        """
+        Returns the parameter with the full name `fullName` if the instrument object already has it, `None` otherwise.
+        Only goes through the parameter and submodule dictionaries, so it never asks the server.
+        """
+        *path, name = fullName.split('.')
+        with self.instrumentLock:
+            module = self.instrument
+            for sm in path:
+                module = module.submodules.get(sm)
+                if module is None:
+                    return None
+            return module.parameters.get(name)
 
-        elif bp.action == 'parameter-update' or bp.action == 'parameter-call':
-            item = self.findItems(fullName, QtCore.Qt.MatchExactly | QtCore.Qt.MatchRecursive, 0)
-            if len(item) == 0:
-                self.addItem(fullName, element=nestedAttributeFromString(self.instrument, fullName))
+    @QtCore.Slot(ParameterBroadcastBluePrint)
+    def updateParameter(self, bp: ParameterBroadcastBluePrint):
+        # Drops the instrument name.
+        fullName = bp.name.partition('.')[2]
+
+        # New values are by far the most common broadcasts, check for them first.
+        if bp.action in _VALUE_ACTIONS:
+            item = self.itemByName(fullName)
+            if item is None:
+                self.addItem(fullName, element=self.parameter(fullName))
             else:
-                # The model can't actually modify the widget since it knows nothing about the view itself.
-                self.itemNewValue.emit(item[0].name, bp.value)
+                # The model can't actually modify the widget since it knows nothing about the view itself. Widgets
+                # skip values they already show themselves, they know whether the user is editing them.
+                self.itemNewValue.emit(item.name, bp.value)
+
+        elif bp.action == 'parameter-creation':
+            # Look in the local copy of the instrument first, only update it (a call to the server for proxy
+            # instruments) if the parameter is not there yet. Holding the lock for both keeps a refresh in the thread
+            # pool from adding the same parameter in between.
+            with self.instrumentLock:
+                param = self._localParameter(fullName)
+                if param is None:
+                    self.instrument.update()
+                    param = self._localParameter(fullName)
+            # A parameter with the same name might have existed before, make sure we get the new object.
+            self._parameterCache.pop(fullName, None)
+            if param is not None:
+                self._parameterCache[fullName] = param
+                # Creation broadcasts only ever touch the new row; a repeated broadcast must not duplicate it.
+                if self.itemByName(fullName) is None:
+                    self.addItem(fullName, element=param)
+
+        elif bp.action == 'parameter-deletion':
+            self._parameterCache.pop(fullName, None)
+            self.removeItem(fullName)
 
     def insertItemTo(self, parent: QtGui.QStandardItem, item):
         if item is not None:
@@ -306,33 +629,60 @@ class ModelParameters(InstrumentModelBase):
             unitItem = QtGui.QStandardItem(unit)
             extraItem = QtGui.QStandardItem()
 
-            if parent == self:
-                rowCount = self.rowCount()
-                self.setItem(rowCount, 0, item)
-                self.setItem(rowCount, 1, unitItem)
-                self.setItem(rowCount, 2, extraItem)
-            else:
-                parent.appendRow([item, unitItem, extraItem])
+            # Inserting the whole row at once emits a single rowsInserted instead of one change per column.
+            parent.appendRow([item, unitItem, extraItem])
 
             self.newItem.emit(item)
 
 
+class _ParameterValuesSignals(QtCore.QObject):
+    #: Signal(dict) --
+    #:  emitted with the values read, by full parameter name.
+    valuesReady = QtCore.Signal(object)
+
+
+class _ParameterValuesRunnable(QtCore.QRunnable):
+    """Reads the values of parameters outside of the GUI thread, for proxy instruments each one is a call to the server.
+
+    :param parameters: The parameters to read, by full name.
+    """
+
+    def __init__(self, parameters: Dict[str, Parameter]):
+        super().__init__()
+        self.parameters = parameters
+        self.signals = _ParameterValuesSignals()
+
+    def run(self):
+        values = {}
+        for name, param in self.parameters.items():
+            try:
+                values[name] = param.get()
+            except Exception as e:
+                logger.warning(f"Could not read parameter '{name}'. {type(e)}: {e.args}")
+        self.signals.valuesReady.emit(values)
+
+
 class ParametersTreeView(InstrumentTreeViewBase):
     def __init__(self, model, *args, **kwargs):
         super().__init__(model, [2], *args, **kwargs)
 
         self.delegate = ParameterDelegate(self)
+        # A single style sheet for the set buttons of all the parameter widgets.
+        self.setStyleSheet(parameters.setButtonStyleSheet)
 
         self.setItemDelegateForColumn(2, self.delegate)
         self.setAllDelegatesPersistent()
 
     @QtCore.Slot(object, object)
     def onItemNewValue(self, itemName, value):
-        widget = self.delegate.parameters[itemName]
-        widget.paramWidget.setValue(value)
+        self.delegate.setValue(itemName, value)
 
 
 class InstrumentParameters(InstrumentDisplayBase):
+
+    #: Time in ms the parameters need to be hidden before their live updates stop.
+    liveUpdatesStopDelay = 5000
+
     def __init__(self, instrument, viewType=ParametersTreeView, callSignals: bool = True, **kwargs):
         if 'instrument' in kwargs:
             del kwargs['instrument']
@@ -352,10 +702,42 @@ class InstrumentParameters(InstrumentDisplayBase):
                          callSignals=callSignals,
                          **modelKwargs)
 
+        # The live updates stop once the parameters have been hidden for `liveUpdatesStopDelay` ms.
+        self._stopUpdatesTimer = QtCore.QTimer(self)
+        self._stopUpdatesTimer.setSingleShot(True)
+        self._stopUpdatesTimer.setInterval(self.liveUpdatesStopDelay)
+        self._stopUpdatesTimer.timeout.connect(self.model.stopLiveUpdates)
+
     def connectSignals(self):
         super().connectSignals()
         self.model.itemNewValue.connect(self.view.onItemNewValue)
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        # Parameters only get live updates while they are shown. If the model was loaded (or hidden) a while ago it
+        # might have missed some changes, it gets synchronized with the instrument.
+        self._stopUpdatesTimer.stop()
+        if self.model.startLiveUpdates():
+            self.refreshAll()
+            self.reloadValues()
+        super().showEvent(event)
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        # Switching back and forth between tabs should not restart the subscription every time.
+        self._stopUpdatesTimer.start()
+        super().hideEvent(event)
+
+    def reloadValues(self):
+        """
+        Reads the values of all the parameters that have a widget again. That happens in the global thread pool, the
+        widgets get the values once they have all been read.
+        """
+        parameters = {name: w._parameter for name, w in self.view.delegate.parameters.items()}
+        if len(parameters) == 0:
+            return
+        runnable = _ParameterValuesRunnable(parameters)
+        runnable.signals.valuesReady.connect(self.model.applyValues)
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
 
 # ----------------- Parameters Display Classes - Ending --------------------------------
 
@@ -367,27 +749,19 @@ class ParameterDeleteDelegate(ParameterDelegate):
     #: Emits the name of the parameter to be deleted when the user presses the delete button.
     removeParameter = QtCore.Signal(str)
 
-    def createEditor(self, widget: QtWidgets.QWidget, option: QtWidgets.QStyleOptionViewItem,
-                     index: QtCore.QModelIndex) -> QtWidgets.QWidget:
-        item = self.getItem(index)
-        element = item.element
+    def makeEditor(self, item: ItemBase, widget: QtWidgets.QWidget) -> QtWidgets.QWidget:
         rw = self.makeRemoveWidget(item.name, widget)
-
-        ret = ParameterWidget(parameter=element, parent=widget, additionalWidgets=[rw])
-        self.parameters[item.name] = ret
-
-        return ret
+        return ParameterWidget(parameter=item.element, parent=widget, additionalWidgets=[rw])
 
     def makeRemoveWidget(self, fullName: str, widget: QtWidgets.QWidget):
         w = QtWidgets.QPushButton(
-            QtGui.QIcon(":/icons/delete.svg"), "", parent=widget)
-        w.setStyleSheet("""
-            QPushButton { background-color: salmon }
-        """)
+            getIcon(":/icons/delete.svg"), "", parent=widget)
+        # Styled by the view's style sheet, see ParameterManagerTreeView.
+        w.setObjectName("removeParameterButton")
         w.setToolTip("Delete this parameter")
         keepSmallHorizontally(w)
 
-        w.pressed.connect(lambda: self.removeParameter.emit(fullName))
+        w.pressed.connect(partial(self.removeParameter.emit, fullName))
         return w
 
 
@@ -397,14 +771,17 @@ class ParameterManagerTreeView(InstrumentTreeViewBase):
         super().__init__(model, [2], *args, **kwargs)
 
         self.delegate = ParameterDeleteDelegate(self)
+        # A single style sheet for all the delete and set buttons, instead of parsing one per button.
+        self.setStyleSheet(parameters.setButtonStyleSheet + """
+            QPushButton#removeParameterButton { background-color: salmon }
+        """)
 
         self.setItemDelegateForColumn(2, self.delegate)
         self.setAllDelegatesPersistent()
 
     @QtCore.Slot(object, object)
     def onItemNewValue(self, itemName, value):
-        widget = self.delegate.parameters[itemName]
-        widget.paramWidget.setValue(value)
+        self.delegate.setValue(itemName, value)
 
 
 class ProfilesManager(QtWidgets.QComboBox):
@@ -428,6 +805,7 @@ class ProfilesManager(QtWidgets.QComboBox):
 
         self.currentIndexChanged.connect(self.onCurrentIndexChanged)
 
+    @QtCore.Slot()
     def refresh(self):
         self.refreshing = True
         currentlySelected = self.currentText()
@@ -444,6 +822,60 @@ class ProfilesManager(QtWidgets.QComboBox):
             self.indexChanged.emit()
 
 
+class _AddParameterSignals(QtCore.QObject):
+    #: Signal(str) --
+    #:  emitted with the full name of the parameter once it has been created.
+    parameterReady = QtCore.Signal(str)
+
+    #: Signal(str) --
+    #:  emitted with the error message when the parameter could not be created.
+    parameterError = QtCore.Signal(str)
+
+
+class _AddParameterRunnable(QtCore.QRunnable):
+    """Parses the value and adds a new parameter to the instrument outside of the GUI thread.
+
+    :param instrument: The instrument (or proxy) the parameter gets added to.
+    :param lock: The lock of the instrument, see `instrumentLock`.
+    :param fullName: Full name of the new parameter.
+    :param value: Value as entered by the user.
+    :param unit: Unit of the parameter.
+    :param ptype: Type of the parameter, used to parse the value.
+    """
+
+    def __init__(self, instrument, lock: threading.RLock, fullName: str, value: str, unit: str,
+                 ptype: ParameterTypes = ParameterTypes.any):
+        super().__init__()
+        self.instrument = instrument
+        self.lock = lock
+        self.fullName = fullName
+        self.value = value
+        self.unit = unit
+        self.ptype = ptype
+        self.signals = _AddParameterSignals()
+
+    def run(self):
+        try:
+            value = parseParameterValue(self.value, self.ptype)
+        except Exception as e:
+            self.signals.parameterError.emit(f"Could not create parameter. "
+                                             f"'{self.value}' is not a valid value: {e.args}")
+            return
+
+        try:
+            with self.lock:
+                # Validators are commented out until they can be serialized.
+                self.instrument.add_parameter(self.fullName, initial_value=value,
+                                              unit=self.unit, )  # vals=vals)
+        except Exception as e:
+            self.signals.parameterError.emit(f"Could not create parameter. "
+                                             f"Adding parameter raised "
+                                             f"{type(e)}: {e.args}")
+            return
+
+        self.signals.parameterReady.emit(self.fullName)
+
+
 class ParameterManagerGui(InstrumentParameters):
     #: Signal(str) --
     #: emitted when there's an error during parameter creation.
@@ -454,9 +886,12 @@ class ParameterManagerGui(InstrumentParameters):
     parameterCreated = QtCore.Signal()
 
     def __init__(self, instrument: Union[ProxyInstrument, ParameterManager], **kwargs):
+        #: serializes access to the instrument between the GUI and the thread pool, shared with the models.
+        self.instrumentLock = instrumentLock(instrument)
         super().__init__(instrument, viewType=ParameterManagerTreeView, callSignals=False, **kwargs)
         self.profileManager = ProfilesManager(parent=self)
         self.addParam = AddParameterWidget(parent=self)
+        self.addParam.nameValidator = self.nameError
         self.layout().insertWidget(0, self.profileManager)
         self.layout().addWidget(self.addParam)
         self.connectSignals()
@@ -476,51 +911,99 @@ class ParameterManagerGui(InstrumentParameters):
         toolbar.addSeparator()
 
         loadParamAction = toolbar.addAction(
-            QtGui.QIcon(":/icons/load.svg"),
+            getIcon(":/icons/load.svg"),
             "Load parameters from file",
         )
-        loadParamAction.triggered.connect(lambda x: self.loadFromFile())
+        loadParamAction.triggered.connect(self._onLoadTriggered)
 
         saveParamAction = toolbar.addAction(
-            QtGui.QIcon(":/icons/save.svg"),
+            getIcon(":/icons/save.svg"),
             "Save parameters to file",
         )
-        saveParamAction.triggered.connect(lambda x: self.saveToFile())
+        saveParamAction.triggered.connect(self._onSaveTriggered)
 
         return toolbar
 
+    @QtCore.Slot(bool)
+    def _onLoadTriggered(self, checked: bool = False):
+        self.loadFromFile()
+
+    @QtCore.Slot(bool)
+    def _onSaveTriggered(self, checked: bool = False):
+        self.saveToFile()
+
+    @QtCore.Slot()
     def refreshAll(self):
         super().refreshAll()
         self.instrument.refresh_profiles()
         self.profileManager.refresh()
 
+    @QtCore.Slot(str)
     def removeParameter(self, fullName: str):
-        if self.instrument.has_param(fullName):
-            self.instrument.remove_parameter(fullName)
+        # The model knows every parameter by name (it follows the creation and deletion broadcasts), asking the
+        # instrument first would be an additional call to the server for proxy instruments.
+        item = self.model.itemByName(fullName)
+        if item is None or item.element is None:
+            return
 
-    def addParameter(self, fullName, value, unit):
         try:
-            # Validators are commented out until they can be serialized.
-            self.instrument.add_parameter(fullName, initial_value=value,
-                                          unit=unit, )  # vals=vals)
-            self.parameterCreated.emit()
+            with self.instrumentLock:
+                self.instrument.remove_parameter(fullName)
         except Exception as e:
-            self.parameterCreationError.emit(f"Could not create parameter."
-                                             f"Adding parameter raised"
-                                             f"{type(e)}: {e.args}")
+            logger.warning(f"Could not remove parameter '{fullName}'. {type(e)}: {e.args}")
+
+    @QtCore.Slot(str, str, str, ParameterTypes, str)
+    def addParameter(self, fullName, value, unit, ptype=ParameterTypes.any, valsArgs=''):
+        """Create a new parameter in the instrument.
+
+        Parsing the value and creating the parameter happens in the global thread pool,
+        so a slow instrument does not block the UI. The result is reported back through
+        ``parameterCreated`` or ``parameterCreationError``.
+        """
+        error = self.nameError(fullName)
+        if error is not None:
+            self.parameterCreationError.emit(f"Could not create parameter. {error}")
             return
 
+        runnable = _AddParameterRunnable(self.instrument, self.instrumentLock,
+                                         fullName, value, unit, ptype)
+        runnable.signals.parameterReady.connect(self.parameterCreated)
+        runnable.signals.parameterError.connect(self.parameterCreationError)
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
+    def nameError(self, fullName: str) -> Optional[str]:
+        """Checks if a new parameter can be called `fullName`.
+
+        :returns: The reason why it cannot, ``None`` if it can.
+        """
+        # The model indexes every parameter and submodule by name, collisions are found without asking the instrument.
+        existing = self.model.itemByName(fullName)
+        if existing is not None:
+            kind = 'submodule' if existing.element is None else 'parameter'
+            return f"'{fullName}' is an existing {kind}."
+
+        parts = fullName.split('.')
+        for i in range(1, len(parts)):
+            prefix = '.'.join(parts[:i])
+            item = self.model.itemByName(prefix)
+            if item is not None and item.element is not None:
+                return f"'{prefix}' is a parameter, and cannot have child parameters."
+
+        return None
+
     @QtCore.Slot()
     def loadProfile(self):
         profileName = self.profileManager.currentText()
-        self.instrument.switch_to_profile(profileName)
+        with self.instrumentLock:
+            self.instrument.switch_to_profile(profileName)
         super().refreshAll()
         self.instrument.refresh_profiles()
 
     @QtCore.Slot()
     def loadFromFile(self, loadFile=None):
         try:
-            self.instrument.fromFile(filePath=loadFile, deleteMissing=False)
+            with self.instrumentLock:
+                self.instrument.fromFile(filePath=loadFile, deleteMissing=False)
             self.refreshAll()
 
         except Exception as e:
@@ -539,6 +1022,23 @@ class ParameterManagerGui(InstrumentParameters):
 # ----------------- Methods Display Classes - Beginning --------------------------------
 
 
+class ItemMethods(ItemBase):
+    """
+    Item of a method. The signature and documentation of the method are slow to get and the widget of a method gets
+    created again every time its row becomes visible, the item keeps them as long as the row exists.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._signatureAndDoc: Optional[Tuple[str, str]] = None
+
+    @property
+    def signatureAndDoc(self) -> Tuple[str, str]:
+        if self._signatureAndDoc is None:
+            self._signatureAndDoc = _signatureAndDoc(self.element)
+        return self._signatureAndDoc
+
+
 class MethodsModel(InstrumentModelBase):
 
     def __init__(self, *args, **kwargs):
@@ -550,12 +1050,7 @@ class MethodsModel(InstrumentModelBase):
         if item is not None:
             extraItem = QtGui.QStandardItem()
 
-            if parent == self:
-                rowCount = self.rowCount()
-                self.setItem(rowCount, 0, item)
-                self.setItem(rowCount, 1, extraItem)
-            else:
-                parent.appendRow([item, extraItem])
+            parent.appendRow([item, extraItem])
 
             self.newItem.emit(item)
 
@@ -571,7 +1066,8 @@ class MethodsDelegate(DelegateBase):
                      index: QtCore.QModelIndex) -> QtWidgets.QWidget:
         item = self.getItem(index)
         element = item.element
-        ret = MethodDisplay(element, item.name, parent=widget)
+        signatureAndDoc = item.signatureAndDoc if isinstance(item, ItemMethods) else None
+        ret = MethodDisplay(element, item.name, parent=widget, signatureAndDoc=signatureAndDoc)
 
         # connecting the widget with the clear alert signal
         self.parent().clearAlertsAction.triggered.connect(ret.alertLabel.clearAlert)
@@ -579,6 +1075,13 @@ class MethodsDelegate(DelegateBase):
         self.methods[item.name] = ret
         return ret
 
+    def sampleEditor(self) -> QtWidgets.QWidget:
+        return MethodDisplay(None, signatureAndDoc=('', ''))
+
+    def destroyEditor(self, editor: QtWidgets.QWidget, index: QtCore.QModelIndex) -> None:
+        self._forgetEditor(self.methods, editor, index)
+        super().destroyEditor(editor, index)
+
 
 class MethodsTreeView(InstrumentTreeViewBase):
     def __init__(self, model, *args, **kwargs):
@@ -610,6 +1113,7 @@ class InstrumentMethods(InstrumentDisplayBase):
 
         super().__init__(instrument=instrument,
                          attr='functions',
+                         itemType=ItemMethods,
                          modelType=MethodsModel,
                          viewType=MethodsTreeView,
                          **modelKwargs)
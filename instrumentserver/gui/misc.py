@@ -1,6 +1,11 @@
 from typing import Optional, Tuple
 
 from .. import QtWidgets, QtGui, QtCore
+from . import getPixmap
+
+
+_ALERT_ALIGNMENT = QtCore.Qt.AlignVCenter | QtCore.Qt.AlignHCenter
+_NO_ALERT_TOOLTIP = 'no alerts'
 
 
 class AlertLabel(QtWidgets.QLabel):
@@ -9,23 +14,20 @@ class AlertLabel(QtWidgets.QLabel):
                  pixmapSize: Optional[Tuple[int, int]] = (20, 20)):
         super().__init__(parent)
 
-        self.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignHCenter)
+        self.setAlignment(_ALERT_ALIGNMENT)
         self._pixmapSize = pixmapSize
-        pix = QtGui.QIcon(":/icons/no-alert.svg").pixmap(*pixmapSize)
-        self.setPixmap(pix)
-        self.setToolTip('no alerts')
+        self.setPixmap(getPixmap(":/icons/no-alert.svg", *pixmapSize))
+        self.setToolTip(_NO_ALERT_TOOLTIP)
 
     @QtCore.Slot(str)
     def setAlert(self, message: str):
-        pix = QtGui.QIcon(":/icons/red-alert.svg").pixmap(*self._pixmapSize)
-        self.setPixmap(pix)
+        self.setPixmap(getPixmap(":/icons/red-alert.svg", *self._pixmapSize))
         self.setToolTip(message)
 
     @QtCore.Slot()
     def clearAlert(self):
-        pix = QtGui.QIcon(":/icons/no-alert.svg").pixmap(*self._pixmapSize)
-        self.setPixmap(pix)
-        self.setToolTip('no alerts')
+        self.setPixmap(getPixmap(":/icons/no-alert.svg", *self._pixmapSize))
+        self.setToolTip(_NO_ALERT_TOOLTIP)
 
 
 class AlertLabelGreen(AlertLabel):
@@ -43,8 +45,7 @@ class AlertLabelGreen(AlertLabel):
 
     @QtCore.Slot(str)
     def setSuccssefulAlert(self, message: str):
-        pix = QtGui.QIcon(":/icons/green-alert.svg").pixmap(*self._pixmapSize)
-        self.setPixmap(pix)
+        self.setPixmap(getPixmap(":/icons/green-alert.svg", *self._pixmapSize))
         self.setToolTip(message)
 
 
@@ -80,17 +81,26 @@ class SeparableTabBar(QtWidgets.QTabBar):
     #: Emitted when the user is moving the tabs.
     onMoveTab = QtCore.Signal(int, int)
 
+    #: Minimum time in ms between two mouse moves that get checked for the start of a drag.
+    moveCheckInterval = 8
+
+    #: Maximum width and height in pixels of the preview shown while dragging a tab.
+    maxDragPreviewSize = 256
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.selectedIndex = 0
         self.dragStartPos = QtCore.QPoint()
         self.dragDroppedPos = QtCore.QPoint()
+        self._startDragDistance = QtWidgets.QApplication.startDragDistance()
+        self._lastMoveCheck = QtCore.QElapsedTimer()
         self.setElideMode(QtCore.Qt.ElideRight)
         self.setAcceptDrops(True)
 
     def mousePressEvent(self, a0: QtGui.QMouseEvent) -> None:
         if a0.button() == QtCore.Qt.LeftButton:
             self.dragStartPos = a0.pos()
+            self._startDragDistance = QtWidgets.QApplication.startDragDistance()
 
         self.dragDroppedPos.setX(0)
         self.dragDroppedPos.setY(0)
@@ -105,23 +115,22 @@ class SeparableTabBar(QtWidgets.QTabBar):
     def mouseMoveEvent(self, a0: QtGui.QMouseEvent) -> None:
         """
         Detects if the user is dragging a tab and starts the drag object.
+        Moves arriving less than ``moveCheckInterval`` ms after the last checked one are passed on directly.
         """
+        if self._lastMoveCheck.isValid() and not self._lastMoveCheck.hasExpired(self.moveCheckInterval):
+            super().mouseMoveEvent(a0)
+            return
+        self._lastMoveCheck.start()
 
-        if (a0.pos() - self.dragStartPos).manhattanLength() > QtWidgets.QApplication.startDragDistance() \
-                and self.selectedIndex != -1:
+        if self.selectedIndex != -1 \
+                and (a0.pos() - self.dragStartPos).manhattanLength() > self._startDragDistance:
 
             drag = QtGui.QDrag(self)
             mimeData = QtCore.QMimeData()
             mimeData.setData('action', b'application/tab-detach')
             drag.setMimeData(mimeData)
 
-            pixmap = self.parentWidget().currentWidget().grab()
-            targetPixmap = QtGui.QPixmap(pixmap.size())
-            targetPixmap.fill(QtCore.Qt.transparent)
-            painter = QtGui.QPainter(targetPixmap)
-            painter.drawPixmap(0, 0, pixmap)
-            painter.end()
-            drag.setPixmap(targetPixmap)
+            drag.setPixmap(self._dragPreview(self.parentWidget().currentWidget()))
 
             dropAction = drag.exec_(QtCore.Qt.MoveAction | QtCore.Qt.CopyAction)
 
@@ -142,14 +151,26 @@ class SeparableTabBar(QtWidgets.QTabBar):
         else:
             super().mouseMoveEvent(a0)
 
+    def _dragPreview(self, widget: QtWidgets.QWidget) -> QtGui.QPixmap:
+        """
+        Renders the top left corner of the widget, at most ``maxDragPreviewSize`` pixels wide and high, for the drag.
+        """
+        image = QtGui.QImage(min(widget.width(), self.maxDragPreviewSize),
+                             min(widget.height(), self.maxDragPreviewSize),
+                             QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(image)
+        widget.render(painter, QtCore.QPoint(), QtGui.QRegion(0, 0, image.width(), image.height()))
+        painter.end()
+        return QtGui.QPixmap.fromImage(image)
+
     def dragEnterEvent(self, a0: QtGui.QDragEnterEvent) -> None:
         mimeData = a0.mimeData()
-        formats = mimeData.formats()
 
-        if 'action' in formats and mimeData.data('action') == 'application/tab-detach':
+        if mimeData.hasFormat('action') and mimeData.data('action') == b'application/tab-detach':
             a0.acceptProposedAction()
 
-        super().dragMoveEvent(a0)
+        super().dragEnterEvent(a0)
 
     def dropEvent(self, a0: QtGui.QDropEvent) -> None:
         self.dragDroppedPos = a0.pos()
@@ -200,8 +221,7 @@ class DetachableTabWidget(QtWidgets.QTabWidget):
         name = self.tabText(tab)
         self.removeTab(self.indexOf(widget))
         detachedTab = DetachedTab(widget, name, parent=self)
-        movedPoint = QtCore.QPoint(point.x(), point.y())
-        detachedTab.move(movedPoint)
+        detachedTab.move(point)
         detachedTab.onCloseSignal.connect(self.onAttatchTab)
         detachedTab.show()
 
@@ -221,11 +241,16 @@ class DetachableTabWidget(QtWidgets.QTabWidget):
         icon = self.tabIcon(fromIndex)
         text = self.tabText(fromIndex)
 
-        self.onCloseTab(fromIndex, True)
-        self.insertTab(toIndex, widget, icon, text)
-        if text in self.unclosableTabs:
-            self._tabBar.tabButton(toIndex, QtWidgets.QTabBar.ButtonPosition.RightSide).resize(0, 0)
-        self.setCurrentWidget(widget)
+        # removing, inserting and selecting the tab get painted once, at the end.
+        self.setUpdatesEnabled(False)
+        try:
+            self.onCloseTab(fromIndex, True)
+            self.insertTab(toIndex, widget, icon, text)
+            if text in self.unclosableTabs:
+                self._tabBar.tabButton(toIndex, QtWidgets.QTabBar.ButtonPosition.RightSide).resize(0, 0)
+            self.setCurrentWidget(widget)
+        finally:
+            self.setUpdatesEnabled(True)
 
     @QtCore.Slot(int)
     def onCloseTab(self, index, moving=False):
@@ -236,9 +261,9 @@ class DetachableTabWidget(QtWidgets.QTabWidget):
         :param moving: If True, will not emit any signals.
         """
         name = self.tabText(index)
-        widget = self.widget(index)
-        widget.close()
-        widget = None
+        # a moved widget gets inserted again right away, it does not need to be closed.
+        if not moving:
+            self.widget(index).close()
         self.removeTab(index)
 
         # When moving the tabs, we don't want to emit the signal since the tab is not being closed, just moved.
@@ -260,7 +285,7 @@ class BaseDialog(QtWidgets.QDialog):
 
     def setWindowTitle(self, p_str):
         super().setWindowTitle(p_str)
-        tittleWidth = self.fontMetrics().boundingRect(p_str).size().width()
+        tittleWidth = self.fontMetrics().horizontalAdvance(p_str)
         minWidth = self.tittleBarButtonsWidth + tittleWidth + 15
         if self.width() < minWidth:
             self.resize(minWidth, self.height())
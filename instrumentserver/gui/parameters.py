@@ -1,11 +1,16 @@
+import cmath
+import copy
 import logging
 import math
 import numbers
-from typing import Any, Optional, List
+import re
+from ast import literal_eval
+from functools import lru_cache
+from typing import Any, Optional, List, Tuple
 
 from qcodes import Parameter
 
-from . import keepSmallHorizontally
+from . import keepSmallHorizontally, getIcon, setStyleProperty
 from .misc import AlertLabel
 from .. import QtWidgets, QtCore, QtGui, resource
 from ..params import ParameterTypes, paramTypeFromVals
@@ -16,6 +21,28 @@ logger = logging.getLogger(__name__)
 # TODO: do all styling with a global style sheet
 
 
+#: Style sheet rules for the `SetButton`s of the parameter widgets. It is set once on the widget containing them (like a
+#: view), so the buttons do not parse a style sheet each.
+setButtonStyleSheet = """
+SetButton[pending="true"] { background-color: orange }
+"""
+
+
+#: Marks a widget that has not shown a value of its parameter yet.
+_NO_VALUE = object()
+
+
+def _sameValue(a: Any, b: Any) -> bool:
+    """Whether showing `b` would not change a widget showing `a`. Values that can't be compared (e.g.: arrays) never
+    are the same, and neither are values of different types (``1 == True == 1.0``)."""
+    if a is _NO_VALUE or type(a) is not type(b):
+        return False
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
 class ParameterWidget(QtWidgets.QWidget):
     """A widget that allows editing and/or displaying a parameter value."""
 
@@ -44,27 +71,24 @@ class ParameterWidget(QtWidgets.QWidget):
         self._parameter = parameter
         self._getMethod = lambda: None
         self._setMethod = lambda x: None
+        # Last value of the parameter the widget was set to, see showValue.
+        self._shownValue: Any = _NO_VALUE
 
-        layout = QtWidgets.QGridLayout(self)
-        self.getButton = QtWidgets.QPushButton(QtGui.QIcon(":/icons/refresh.svg"),
+        self.getButton = QtWidgets.QPushButton(getIcon(":/icons/refresh.svg"),
                                                "", parent=self)
         self.getButton.pressed.connect(self.setWidgetFromParameter)
         keepSmallHorizontally(self.getButton)
-        layout.addWidget(self.getButton, 0, 1)
-
-        self.setButton = SetButton(QtGui.QIcon(":/icons/set.svg"), "", parent=self)
-        keepSmallHorizontally(self.setButton)
-        layout.addWidget(self.setButton, 0, 2)
-
-        self.alertWidget = AlertLabel(self)
-        layout.addWidget(self.alertWidget, 0, 3)
 
-        # an input field will only be created if we have a set method.
+        # an input field, the set button and the alert will only be created if we have a set method.
+        self.setButton: Optional[SetButton] = None
+        self.alertWidget: Optional[AlertLabel] = None
         if hasattr(parameter, 'set'):
+            self.setButton = SetButton(getIcon(":/icons/set.svg"), "", parent=self)
+            keepSmallHorizontally(self.setButton)
+            self.alertWidget = AlertLabel(self)
 
-            self.parameterSet.connect(lambda x: self.setButton.setPending(False))
-            self.parameterSet.connect(lambda x: self.alertWidget.clearAlert())
-            self.parameterPending.connect(lambda x: self.setButton.setPending(True))
+            self.parameterSet.connect(self._onParameterSet)
+            self.parameterPending.connect(self._onParameterPending)
             self.parameterSetError.connect(self.alertWidget.setAlert)
             self.setButton.pressed.connect(self.getAndEmitValueFromWidget)
 
@@ -121,20 +145,15 @@ class ParameterWidget(QtWidgets.QWidget):
 
         # if we have no set method, then it'll be read-only
         else:
-            self.setButton.setDisabled(True)
             self.paramWidget = QtWidgets.QLabel(self)
             self._setMethod = lambda x: self.paramWidget.setText(str(x))
 
-        layout.addWidget(self.paramWidget, 0, 0)
-        for i, w in enumerate(additionalWidgets):
-            layout.addWidget(w, 0, 4 + i)
-
-        for i in range(layout.columnCount()):
-            if i == 0:
-                layout.setColumnStretch(i, 1)
-            else:
-                layout.setColumnStretch(i, 0)
-
+        # a single row: only the input stretches, the buttons and alert keep their size.
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.addWidget(self.paramWidget, 1)
+        for w in [self.getButton, self.setButton, self.alertWidget] + list(additionalWidgets):
+            if w is not None:
+                layout.addWidget(w)
         layout.setContentsMargins(1, 1, 1, 1)
         self.setLayout(layout)
 
@@ -145,6 +164,14 @@ class ParameterWidget(QtWidgets.QWidget):
         self.paramWidget.input.deselect()
         self.setButton.setFocus()
 
+    @QtCore.Slot(object)
+    def _onParameterSet(self, value: Any):
+        self.setButton.setPending(False)
+        self.alertWidget.clearAlert()
+
+    @QtCore.Slot(object)
+    def _onParameterPending(self, value: Any):
+        self.setButton.setPending(True)
 
     def setParameter(self, value: Any):
         try:
@@ -154,11 +181,26 @@ class ParameterWidget(QtWidgets.QWidget):
                                         f" {e.args}")
             return
 
+        self._shownValue = value
         self.parameterSet.emit(value)
 
     def setPending(self, value: Any):
         self.parameterPending.emit(value)
 
+    def isPending(self) -> bool:
+        """Whether the input holds a value that has not been set yet."""
+        return self.setButton is not None and bool(self.setButton.property('pending'))
+
+    def showValue(self, value: Any):
+        """
+        Shows a new value of the parameter (e.g.: from a broadcast). Nothing happens if the widget already shows that
+        value, unless its input holds a value that has not been set yet: that gets replaced.
+        """
+        if not self.isPending() and _sameValue(self._shownValue, value):
+            return
+        self._setMethod(value)
+        self._shownValue = value
+
     @QtCore.Slot()
     def getAndEmitValueFromWidget(self):
         self._valueFromWidget.emit(self._getMethod())
@@ -167,22 +209,31 @@ class ParameterWidget(QtWidgets.QWidget):
     def setWidgetFromParameter(self):
         val = self._parameter.get()
         self._setMethod(val)
+        self._shownValue = val
         self.parameterSet.emit(val)
 
 
 class AnyInput(QtWidgets.QWidget):
     #: Signal(str) --
     #: emitted when the input field is changed, argument is the new value.
+    #: A burst of edits (like typing) only emits once, ``inputChangedDelay`` ms after the last edit.
     inputChanged = QtCore.Signal(str)
 
+    inputChangedDelay = 80
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.input = QtWidgets.QLineEdit()
         self.input.textEdited.connect(self._processTextEdited)
 
+        self._inputTimer = QtCore.QTimer(self)
+        self._inputTimer.setSingleShot(True)
+        self._inputTimer.setInterval(self.inputChangedDelay)
+        self._inputTimer.timeout.connect(self._emitInputChanged)
+
         self.doEval = QtWidgets.QPushButton(
-            QtGui.QIcon(":/icons/python.svg"), "", parent=self,
+            getIcon(":/icons/python.svg"), "", parent=self,
         )
         self.doEval.setCheckable(True)
         self.doEval.setChecked(True)
@@ -201,9 +252,12 @@ QPushButton:checked { background-color: palegreen }
 """)
 
     def value(self):
+        # the value is being used now, a change notification still waiting would come after it.
+        self._inputTimer.stop()
         if self.doEval.isChecked():
+            # plain literals (the usual numbers, strings, lists...) do not need to go through eval.
             try:
-                ret = eval(self.input.text())
+                ret, _ = _evalArgument(self.input.text())
             except Exception as e:
                 ret = self.input.text()
             return ret
@@ -215,7 +269,50 @@ QPushButton:checked { background-color: palegreen }
 
     @QtCore.Slot(str)
     def _processTextEdited(self, val: str):
-        self.inputChanged.emit(val)
+        self._inputTimer.start()
+
+    @QtCore.Slot()
+    def _emitInputChanged(self):
+        self.inputChanged.emit(self.input.text())
+
+
+@lru_cache(maxsize=128)
+def _compileInput(text: str):
+    """Compiles the text of an input field for ``eval``.
+    Setting the same value repeatedly only compiles it once."""
+    # like eval does for strings, leading spaces and tabs are ignored.
+    return compile(text.lstrip(' \t'), '<input>', 'eval')
+
+
+#: Unsigned imaginary literals and (signed) integer and float literals, following Python's rules.
+#: These are the only strings converted without ``eval``.
+_NUMBER_LITERAL = re.compile(r'[+-]?(?:0+|[1-9][0-9]*)'
+                             r'|[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+(?=[eE]))(?:[eE][+-]?[0-9]+)?'
+                             r'|(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+)(?:[eE][+-]?[0-9]+)?[jJ]')
+
+
+def _parseNumber(value: str) -> Optional[numbers.Number]:
+    """Read a string as a number, ``None`` if it isn't one.
+    Plain literals get converted directly, only other expressions go through ``eval``.
+    Words like 'nan' or 'inf' are not numbers, as they are not for ``eval``."""
+    if _NUMBER_LITERAL.fullmatch(value):
+        for convert in (int, float, complex):
+            try:
+                val = convert(value)
+            except ValueError:
+                continue
+            # A literal that is too large to be finite (like 1e400) is left to eval, which gives the same result.
+            if cmath.isfinite(val):
+                return val
+            break
+
+    try:
+        val = eval(value)
+    except:
+        return None
+    if isinstance(val, numbers.Number):
+        return val
+    return None
 
 
 class NumberInput(QtWidgets.QLineEdit):
@@ -226,12 +323,7 @@ class NumberInput(QtWidgets.QLineEdit):
         self.textChanged.connect(self.checkIfNumber)
 
     def checkIfNumber(self, value: str):
-        try:
-            val = eval(value)
-        except:
-            val = None
-
-        if not isinstance(val, numbers.Number):
+        if _parseNumber(value) is None:
             self.setStyleSheet("""
             NumberInput { background-color: pink }
             """)
@@ -241,14 +333,7 @@ class NumberInput(QtWidgets.QLineEdit):
             """)
 
     def value(self):
-        try:
-            value = eval(self.text())
-        except:
-            return None
-        if isinstance(value, numbers.Number):
-            return value
-        else:
-            return None
+        return _parseNumber(self.text())
 
     def setValue(self, value: numbers.Number):
         self.setText(str(value))
@@ -263,33 +348,64 @@ class AnyInputForMethod(AnyInput):
     All arguments and keyword arguments are evaluated if the doEval button is checked, if not everything is treated like
     a long string.
     """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Text and arguments of the last input that only contained literals, pressing run again without editing
+        # does not need to parse it again.
+        self._lastText: Optional[str] = None
+        self._lastArguments: Optional[Tuple[tuple, dict]] = None
+
     def value(self):
         if self.doEval.isChecked():
+            text = self.input.text()
             # If '=' is present we need to separate the keyword from the value
             # If ',' is present we have more than one argument.
-            if '=' in self.input.text() or ',' in self.input.text():
-                rawArgs = self.input.text().split(',')
-                args = []
-                kwargs = {}
-                for x in rawArgs:
-                    if '=' in x:
-                        key, value = x.split('=')
-                        key = key.replace(" ", "")
-                        kwargs[key] = eval(value)
-                    else:
-                        args.append(eval(x))
-                return tuple(args), kwargs
+            if '=' in text or ',' in text:
+                if text != self._lastText:
+                    rawArgs = text.split(',')
+                    args = []
+                    kwargs = {}
+                    allLiterals = True
+                    for x in rawArgs:
+                        if '=' in x:
+                            key, value = x.split('=')
+                            key = key.replace(" ", "")
+                            kwargs[key], isLiteral = _evalArgument(value)
+                        else:
+                            value, isLiteral = _evalArgument(x)
+                            args.append(value)
+                        allLiterals = allLiterals and isLiteral
+
+                    # Anything else than literals might evaluate to something different next time.
+                    if not allLiterals:
+                        return tuple(args), kwargs
+                    self._lastText = text
+                    self._lastArguments = (tuple(args), kwargs)
+
+                # The method might modify its arguments, it always gets fresh copies.
+                return copy.deepcopy(self._lastArguments)
             else:
                 return super().value(), None
 
         return self.input.text(), None
 
 
+def _evalArgument(value: str) -> Tuple[Any, bool]:
+    """Evaluates a single argument typed by the user.
+
+    :returns: The value and whether it was a plain literal. Only arguments that aren't go through ``eval``.
+    """
+    try:
+        return literal_eval(value.strip()), True
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return eval(_compileInput(value)), False
+
+
 class SetButton(QtWidgets.QPushButton):
+    """Button that sets the value of a parameter. Its 'pending' property is true while the input holds a value
+    that has not been set yet, views containing set buttons show that with `setButtonStyleSheet`."""
 
     @QtCore.Slot(bool)
     def setPending(self, isPending: bool):
-        if isPending:
-            self.setStyleSheet("SetButton { background-color: orange }")
-        else:
-            self.setStyleSheet("SetButton {}")
+        setStyleProperty(self, 'pending', isPending)
@@ -63,6 +63,8 @@ class DFListener(Listener):
             self.df = pd.DataFrame(columns=["time","name","value","unit"])
 
         self.paramList = paramList
+        # checked for every broadcast, a set keeps the lookup O(1)
+        self.paramSet = set(paramList)
         self.path = path
 
     def run(self):
@@ -75,7 +77,7 @@ class DFListener(Listener):
             logger.info(f"Writing data [{message.name},{message.value},{message.unit}]")
             self.df.loc[len(self.df)]=[datetime.datetime.now(),message.name,message.value,message.unit]
             self.df.to_csv(self.path)
-        elif message.name in self.paramList:
+        elif message.name in self.paramSet:
             logger.info(f"Writing data [{message.name},{message.value},{message.unit}]")
             self.df.loc[len(self.df)]=[datetime.datetime.now(),message.name,message.value,message.unit]
             self.df.to_csv(self.path)
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Any, Dict, Union, List
+from typing import Any, Dict, Union, List, Tuple
 from enum import Enum, unique, auto
 import logging
 
@@ -14,6 +14,23 @@ from . import serialize
 
 logger = logging.getLogger(__name__)
 
+# json.dumps builds a new encoder whenever it gets options, so the ones used for saving are created once.
+_entryEncoder = json.JSONEncoder(indent=2, sort_keys=True)
+_nameEncoder = json.JSONEncoder()
+
+
+def _jsonSnapshot(obj: Any) -> Any:
+    """Immutable copy of ``obj`` that also records the type of every value.
+
+    Two snapshots only compare equal if json would write the same text for both, unlike the objects themselves
+    (``1 == True == 1.0``). Changing a list of the original in place does not change the snapshot.
+    """
+    if isinstance(obj, dict):
+        return dict, tuple((k, _jsonSnapshot(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return list, tuple(_jsonSnapshot(v) for v in obj)
+    return type(obj), obj
+
 
 @unique
 class ParameterTypes(Enum):
@@ -58,11 +75,12 @@ def paramTypeFromVals(vals: validators.Validator) -> Union[ParameterTypes, None]
     return None
 
 
+#: Parameter types by their name, see :func:`paramTypeFromName`.
+_parameterTypesByName = {v['name']: k for k, v in parameterTypes.items()}
+
+
 def paramTypeFromName(name: str) -> Union[ParameterTypes, None]:
-    for k, v in parameterTypes.items():
-        if name == v['name']:
-            return k
-    return None
+    return _parameterTypesByName.get(name)
 
 
 class ParameterManager(InstrumentBase):
@@ -85,6 +103,9 @@ class ParameterManager(InstrumentBase):
 
         self._workingDirectory = Path(os.getcwd())
 
+        # Serialized entries of the last save, see _dumpParamDict.
+        self._jsonFragments: Dict[str, Tuple[Any, str]] = {}
+
         #: default location and name of the parameters save file.
         self.selectedProfile = self.fullProfileName(self.name)
         self.profiles = []
@@ -173,7 +194,7 @@ class ParameterManager(InstrumentBase):
     def _get_param(self, param_name: str) -> Parameter:
         parent = self._get_parent(param_name)
         try:
-            param = parent.parameters[param_name.split('.')[-1]]
+            param = parent.parameters[param_name.rpartition('.')[2]]
             return param
         except KeyError:
             raise ValueError(f"Parameter '{param_name}' does not exist")
@@ -181,20 +202,18 @@ class ParameterManager(InstrumentBase):
     def _get_parent(self, param_name: str, create_parent: bool = False) \
             -> 'ParameterManager':
 
-        split_names = param_name.split('.')
         parent = self
-        full_name = self.name
-
-        for i, n in enumerate(split_names[:-1]):
-            full_name += f'.{n}'
+        for n in param_name.split('.')[:-1]:
             if n in parent.parameters:
                 raise ValueError(f"{n} is a parameter, and cannot have child parameters.")
-            if n not in parent.submodules:
+            submodule = parent.submodules.get(n)
+            if submodule is None:
                 if create_parent:
-                    parent.add_submodule(n, ParameterManager(n))
+                    submodule = ParameterManager(n)
+                    parent.add_submodule(n, submodule)
                 else:
                     raise ValueError(f'{n} does not exist.')
-            parent = parent.submodules[n]
+            parent = submodule
         return parent
 
     def has_param(self, param_name: str):
@@ -226,17 +245,32 @@ class ParameterManager(InstrumentBase):
         kw['set_cmd'] = None
 
         parent = self._get_parent(name, create_parent=True)
+        pname = name.rpartition('.')[2]
         if parent is self:
-            super().add_parameter(name.split('.')[-1], **kw)
+            super().add_parameter(pname, **kw)
         else:
-            parent.add_parameter(name.split('.')[-1], **kw)
+            parent.add_parameter(pname, **kw)
 
     def remove_parameter(self, param_name: str, cleanup: bool = True):
         parent = self._get_parent(param_name)
-        pname = param_name.split('.')[-1]
+        pname = param_name.rpartition('.')[2]
         del parent.parameters[pname]
         if cleanup:
-            self.remove_empty_submodules()
+            self._remove_empty_parents(param_name)
+
+    def _remove_empty_parents(self, param_name: str):
+        """Delete the submodules on the path of ``param_name`` that are left empty.
+        Only the path of a removed parameter can become empty, so the rest of the tree is not visited."""
+        names = param_name.split('.')[:-1]
+        modules = [self]
+        for n in names:
+            modules.append(modules[-1].submodules[n])
+
+        for i in range(len(names), 0, -1):
+            module = modules[i]
+            if len(module.submodules) > 0 or len(module.parameters) > 0:
+                break
+            del modules[i - 1].submodules[names[i - 1]]
 
     def get(self, param_name: str) -> Any:
         param = self._get_param(param_name)
@@ -353,17 +387,25 @@ class ParameterManager(InstrumentBase):
                 val = paramDict[f"{self.name}.{pn}"]['value']
                 unit = paramDict[f"{self.name}.{pn}"].get('unit', '')
 
-            if self.has_param(pn):
-                self.parameter(pn)(val)
+            # Look the parameter up only once, instead of once for the check and once per use.
+            try:
+                param = self._get_param(pn)
+            except ValueError:
+                param = None
+
+            if param is not None:
+                param(val)
                 if unit is not None:
-                    self.parameter(pn).unit = unit
+                    param.unit = unit
 
             else:
                 self.add_parameter(pn, initial_value=val, unit=unit)
 
-        for pn in currentParams:
-            if pn not in fileParams and deleteMissing:
-                self.remove_parameter(pn)
+        if deleteMissing:
+            fileParamsSet = set(fileParams)
+            for pn in currentParams:
+                if pn not in fileParamsSet:
+                    self.remove_parameter(pn)
 
     def toParamDict(self, simpleFormat: bool = False, includeMeta: List[str] = ['unit']):
         params = serialize.toParamDict([self], simpleFormat=simpleFormat,
@@ -398,12 +440,41 @@ class ParameterManager(InstrumentBase):
         if not os.path.exists(folder):
             os.makedirs(folder)
         with open(filePath, 'w') as f:
-            json.dump(params, f, indent=2, sort_keys=True)
+            f.write(self._dumpParamDict(params))
 
         file = str(file)
         if file.startswith("parameter_manager-") and file.endswith(".json"):
             self.selectedProfile = file
 
+    def _dumpParamDict(self, params: Dict[str, Any]) -> str:
+        """Return the same string as ``json.dumps(params, indent=2, sort_keys=True)``.
+
+        The serialized entry of each parameter is cached together with a snapshot of the entry it came from,
+        so saving again only serializes the parameters that changed since the last save.
+        """
+        if len(params) == 0:
+            return '{}'
+
+        fragments = {}
+        for name in sorted(params):
+            entry = params[name]
+            snapshot = _jsonSnapshot(entry)
+            cached = self._jsonFragments.get(name)
+            try:
+                unchanged = cached is not None and bool(cached[0] == snapshot)
+            except Exception:
+                unchanged = False
+
+            if unchanged:
+                fragments[name] = cached
+            else:
+                fragment = _nameEncoder.encode(name) + ': ' + \
+                    _entryEncoder.encode(entry).replace('\n', '\n  ')
+                fragments[name] = (snapshot, fragment)
+
+        self._jsonFragments = fragments
+        return '{\n  ' + ',\n  '.join(f for _, f in fragments.values()) + '\n}'
+
     def list_profiles(self) -> List[str]:
         """
         Returns a list of all profiles.
@@ -3,6 +3,7 @@ import importlib
 import logging
 import os
 import time
+from contextlib import contextmanager
 from typing import Union, Optional, Any, Dict
 
 from instrumentserver.client import QtClient
@@ -13,6 +14,7 @@ from .core import (
     InstrumentModuleBluePrint, ParameterBluePrint
 )
 from .. import QtCore, QtWidgets, QtGui, Client
+from ..gui import getIcon
 from ..gui.misc import DetachableTabWidget, BaseDialog
 from ..gui.parameters import AnyInputForMethod
 from ..gui.instruments import GenericInstrument
@@ -47,9 +49,13 @@ class StationList(QtWidgets.QTreeWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Top-level items by instrument name, so they can be found without searching the tree.
+        self._itemsByName: Dict[str, QtWidgets.QTreeWidgetItem] = {}
+
         self.setColumnCount(len(self.cols))
         self.setHeaderLabels(self.cols)
         self.setSortingEnabled(True)
+        self.setUniformRowHeights(True)
         self.clear()
 
         self.deleteAction = QtWidgets.QAction("Close Instrument")
@@ -65,15 +71,41 @@ class StationList(QtWidgets.QTreeWidget):
         self.deleteAction.triggered.connect(self.onDeleteAction)
         self.itemSelectionChanged.connect(self._processSelection)
 
-    def addInstrument(self, bp: InstrumentModuleBluePrint):
+    def addInstrument(self, bp: InstrumentModuleBluePrint, resizeColumns: bool = True):
+        """Add an instrument to the list.
+
+        :param bp: The blueprint of the instrument.
+        :param resizeColumns: If ``False``, the columns do not get resized to fit the new item. Useful when adding
+            many instruments at once, the columns can then be resized only once at the end.
+        """
         lst = [bp.name, f"{bp.instrument_module_class.split('.')[-1]}"]
-        self.addTopLevelItem(QtWidgets.QTreeWidgetItem(lst))
-        self.resizeColumnToContents(0)
+        item = QtWidgets.QTreeWidgetItem(lst)
+        self._itemsByName[bp.name] = item
+        self.addTopLevelItem(item)
+        if resizeColumns:
+            self.resizeColumnToContents(0)
+
+    @contextmanager
+    def bulkUpdate(self):
+        """Context manager for adding or removing many items at once. Sorting, repainting and signals are
+        suspended inside of it, so the list gets sorted and repainted only once at the end."""
+        self.setUpdatesEnabled(False)
+        self.setSortingEnabled(False)
+        self.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.blockSignals(False)
+            self.setSortingEnabled(True)
+            self.setUpdatesEnabled(True)
+
+    def clear(self):
+        super().clear()
+        self._itemsByName.clear()
 
     def removeObject(self, name: str):
-        items = self.findItems(name, QtCore.Qt.MatchExactly | QtCore.Qt.MatchRecursive, 0)
-        if len(items) > 0:
-            item = items[0]
+        item = self._itemsByName.pop(name, None)
+        if item is not None:
             idx = self.indexOfTopLevelItem(item)
             self.takeTopLevelItem(idx)
             del item
@@ -279,6 +311,9 @@ class PossibleInstrumentsDisplay(QtWidgets.QTreeWidget):
         self.setColumnCount(len(self.cols))
         self.setHeaderLabels(self.cols)
 
+        # Top-level items of each instrument type by type name, so they can be found without searching the tree.
+        self._typeItems: Dict[str, PossibleInstrumentDisplayItem] = {}
+
         self.basedInstrumentAction = QtWidgets.QAction(f'Create instrument based on this')
         self.basedInstrumentAction.setShortcut('N')
         # you need to add the action to the widget so that it can detect the shortcut
@@ -318,15 +353,14 @@ class PossibleInstrumentsDisplay(QtWidgets.QTreeWidget):
         creates it
         """
         insType = fullInsType.split('.')[-1]
-        items = self.findItems(insType, QtCore.Qt.MatchExactly | QtCore.Qt.MatchExactly, 0)
+        parent = self._typeItems.get(insType)
 
         # Only add the instrument to the tree if there are no other instruments of the same type already
-        if len(items) == 0:
+        if parent is None:
             parent = PossibleInstrumentDisplayItem(text=[insType, '', ''], fullInsType=fullInsType,)
+            self._typeItems[insType] = parent
             self.addTopLevelItem(parent)
             self.expand(self.indexFromItem(parent, 0))
-        else:
-            parent = items[0]
 
         if configName is None and insName in self.config:
             configName = insName
@@ -365,13 +399,22 @@ class PossibleInstrumentsDisplay(QtWidgets.QTreeWidget):
                     del self.config[item.configName]
                 parent.removeChild(item)
                 if parent.childCount() == 0:
-                    self.takeTopLevelItem((self.indexOfTopLevelItem(parent)))
+                    self._removeTypeItem(parent)
             else:
                 for i in range(item.childCount()):
                     child = item.child(i)
                     if child.configName in self.config:
                         del self.config[child.configName]
-                self.takeTopLevelItem(self.indexOfTopLevelItem(item))
+                self._removeTypeItem(item)
+
+    def _removeTypeItem(self, item: PossibleInstrumentDisplayItem):
+        if self._typeItems.get(item.text(0)) is item:
+            del self._typeItems[item.text(0)]
+        self.takeTopLevelItem(self.indexOfTopLevelItem(item))
+
+    def clear(self):
+        super().clear()
+        self._typeItems.clear()
 
 
 class InstrumentsCreator(QtWidgets.QWidget):
@@ -546,7 +589,7 @@ class ServerGui(QtWidgets.QMainWindow):
         # Station tools.
         self.toolBar.addWidget(QtWidgets.QLabel('Station:'))
         self.refreshStationAction = QtWidgets.QAction(
-            QtGui.QIcon(":/icons/refresh.svg"), 'Refresh', self)
+            getIcon(":/icons/refresh.svg"), 'Refresh', self)
         self.refreshStationAction.triggered.connect(self.refreshStationComponents)
         self.toolBar.addAction(self.refreshStationAction)
 
@@ -555,12 +598,12 @@ class ServerGui(QtWidgets.QMainWindow):
         self.toolBar.addWidget(QtWidgets.QLabel('Params:'))
 
         self.loadParamsAction = QtWidgets.QAction(
-            QtGui.QIcon(":/icons/load.svg"), 'Load from file', self)
+            getIcon(":/icons/load.svg"), 'Load from file', self)
         self.loadParamsAction.triggered.connect(self.loadParamsFromFile)
         self.toolBar.addAction(self.loadParamsAction)
 
         self.saveParamsAction = QtWidgets.QAction(
-            QtGui.QIcon(":/icons/save.svg"), 'Save to file', self)
+            getIcon(":/icons/save.svg"), 'Save to file', self)
         self.saveParamsAction.triggered.connect(self.saveParamsToFile)
         self.toolBar.addAction(self.saveParamsAction)
 
@@ -664,11 +707,12 @@ class ServerGui(QtWidgets.QMainWindow):
     def refreshStationComponents(self):
         """Clear and re-populate the widget holding the station components, using
         the objects that are currently registered in the station."""
-        self.stationList.clear()
-        for ins in self.client.list_instruments():
-            bp = self.client.getBluePrint(ins)
-            self.stationList.addInstrument(bp)
-            self._bluePrints[ins] = bp
+        with self.stationList.bulkUpdate():
+            self.stationList.clear()
+            for ins in self.client.list_instruments():
+                bp = self.client.getBluePrint(ins)
+                self.stationList.addInstrument(bp, resizeColumns=False)
+                self._bluePrints[ins] = bp
         self.stationList.resizeColumnToContents(0)
 
     def loadParamsFromFile(self):
@@ -413,15 +413,17 @@ class StationServer(QtCore.QObject):
         :param kwargs: kwargs being passed to the call method.
         """
 
-        if spec.target.split('.')[-1] == 'add_parameter':
-            name = spec.target.split('.')[0] + '.' + '.'.join(spec.args)
+        instrumentName = spec.target.partition('.')[0]
+        method = spec.target.rpartition('.')[2]
+        if method == 'add_parameter':
+            name = instrumentName + '.' + '.'.join(spec.args)
             pb = ParameterBroadcastBluePrint(name,
                                              'parameter-creation',
                                              kwargs['initial_value'],
                                              kwargs['unit'])
             self._broadcastParameterChange(pb)
-        elif spec.target.split('.')[-1] == 'remove_parameter':
-            name = spec.target.split('.')[0] + '.' + '.'.join(spec.args)
+        elif method == 'remove_parameter':
+            name = instrumentName + '.' + '.'.join(spec.args)
             pb = ParameterBroadcastBluePrint(name,
                                              'parameter-deletion')
             self._broadcastParameterChange(pb)
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from .. import QtCore
 
@@ -15,24 +15,32 @@ class PollingWorker(QtCore.QThread):
         # This worker is supposed to only run through the server itself so there is no need to change the defaults of the client.
         self.cli = Client()
         self.pollingRates = pollingRates
+        # Polled parameters by full name. Finding one asks the server for the instrument, that only happens once.
+        self._parameters: Dict[str, Any] = {}
 
     # Used by the qtimers, get value of the param
     def getParamValue(self, paramName):
-        parts = paramName.split(".")
-        instr = self.cli.find_or_create_instrument(parts[0])
-        param = parts[1]
-        for part in parts[2:]:
-            param = param + "." + part
-        logger.info(f"{paramName} currently has value {nestedAttributeFromString(instr, param)()}.")
+        param = self._parameters.get(paramName)
+        if param is None:
+            instrumentName, _, paramPath = paramName.partition(".")
+            instr = self.cli.find_or_create_instrument(instrumentName)
+            param = nestedAttributeFromString(instr, paramPath)
+            self._parameters[paramName] = param
+        logger.info(f"{paramName} currently has value {param()}.")
 
     # Creates a qtimer for each param in the dict with the interval specified
     def run(self):
         timers = []
 
         # Deletes param from dict if it does not exist
+        # The names of the parameters of each instrument, so the server gets asked only once per instrument.
+        existingParams = {}
         delList = []
         for param in self.pollingRates:
-            if param not in self.cli.getParamDict(param.split(".")[0]):
+            instrument = param.split(".")[0]
+            if instrument not in existingParams:
+                existingParams[instrument] = set(self.cli.getParamDict(instrument))
+            if param not in existingParams[instrument]:
                 logger.warning(f"Parameter {param} does not exist")
                 delList.append(param)
         for item in delList:
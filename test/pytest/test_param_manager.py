@@ -193,3 +193,59 @@ def test_selectedProfile_only_changing_when_correct_name(tmp_path):
     params.fromFile(new_path)
     assert params.selectedProfile == 'parameter_manager-names.json'
 
+
+def test_dump_matches_json_dumps_when_values_change_type():
+    params = ParameterManager(name='params')
+
+    entries = [
+        {'params.a': {'value': 1, 'unit': 'M'}},
+        {'params.a': {'value': True, 'unit': 'M'}},
+        {'params.a': {'value': 1.0, 'unit': 'M'}},
+        {'params.a': {'value': 1, 'unit': 'M'}},
+    ]
+    for paramDict in entries:
+        assert params._dumpParamDict(paramDict) == json.dumps(paramDict, indent=2, sort_keys=True)
+
+
+def test_dump_matches_json_dumps_for_nested_values():
+    params = ParameterManager(name='params')
+
+    value = {'x': [1, {'y': 2}], 'z': {'w': 0}}
+    paramDict = {'params.a': {'value': value, 'unit': ''}, 'params.b': {'value': [1, 2], 'unit': 'V'}}
+    assert params._dumpParamDict(paramDict) == json.dumps(paramDict, indent=2, sort_keys=True)
+
+    # changes deep inside a value, also ones made in place, must show up in the next dump.
+    value['x'][1]['y'] = True
+    value['z']['w'] = 0.0
+    paramDict['params.b']['value'].append(3)
+    assert params._dumpParamDict(paramDict) == json.dumps(paramDict, indent=2, sort_keys=True)
+
+    del paramDict['params.b']
+    assert params._dumpParamDict(paramDict) == json.dumps(paramDict, indent=2, sort_keys=True)
+
+
+def test_removing_param_removes_only_empty_parents():
+    params = ParameterManager(name='params')
+    prep_param_manager(params)
+
+    params.remove_parameter('nested_param.how.are.you')
+    assert 'are' in params.nested_param.how.submodules
+
+    params.remove_parameter('nested_param.how.are.too')
+    assert 'how' not in params.nested_param.submodules
+    assert params.nested_param.child1() == 456
+
+    params.remove_parameter('nested_param.child1')
+    params.remove_parameter('nested_param.child2')
+    assert 'nested_param' not in params.submodules
+    assert params.list() == ['my_param']
+
+
+def test_removing_param_without_cleanup_keeps_empty_parents():
+    params = ParameterManager(name='params')
+    prep_param_manager(params)
+
+    params.remove_parameter('nested_param.how.are.you', cleanup=False)
+    params.remove_parameter('nested_param.how.are.too', cleanup=False)
+    assert len(params.nested_param.how.are.parameters) == 0
+    assert 'are' in params.nested_param.how.submodules
@@ -0,0 +1,110 @@
+import math
+import threading
+from ast import literal_eval
+
+import pytest
+
+from instrumentserver.params import ParameterManager, ParameterTypes
+from instrumentserver.gui.instruments import _parseAny, parseParameterValue, _AddParameterRunnable
+from instrumentserver.gui.parameters import _parseNumber
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('1', 1),
+    ('-2', -2),
+    ('1.5', 1.5),
+    ('1e3', 1000.0),
+    ('1+2j', 1 + 2j),
+    ('2.5j', 2.5j),
+    ('2*3', 6),
+])
+def test_parse_number(text, expected):
+    value = _parseNumber(text)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+@pytest.mark.parametrize('text', ['nan', 'NaN', 'inf', '-inf', 'infinity', 'j', 'J', '007', 'x', '',
+                                  '[1, 2]'])
+def test_parse_number_rejects_non_numbers(text):
+    assert _parseNumber(text) is None
+
+
+def test_parse_number_too_large_literal():
+    assert _parseNumber('1e400') == math.inf
+
+
+@pytest.mark.parametrize('text', ['0', '12', '-3', '+4', '1.5', '-.5', '2.', '1e3', '1E-3', '-2.5e+2',
+                                  '[1, 2]', "{'a': 1}", "'text'", 'True', 'None', '1+2j'])
+def test_parse_any_matches_literal_eval(text):
+    value = _parseAny(text)
+    assert value == literal_eval(text)
+    assert type(value) is type(literal_eval(text))
+
+
+@pytest.mark.parametrize('text', ['abc', '007', '1.2.3', 'my value', '[1, 2', '{[1]: 2}', '{{}}'])
+def test_parse_any_falls_back_to_string(text):
+    assert _parseAny(text) == text
+
+
+@pytest.mark.parametrize('text, ptype, expected', [
+    ('1', ParameterTypes.numeric, 1.0),
+    ('-12', ParameterTypes.integer, -12),
+    ('1+2j', ParameterTypes.complex, 1 + 2j),
+    ('abc', ParameterTypes.string, 'abc'),
+    ('12', ParameterTypes.string, '12'),
+    ('True', ParameterTypes.bool, True),
+    (' yes ', ParameterTypes.bool, True),
+    ('1', ParameterTypes.bool, True),
+    ('false', ParameterTypes.bool, False),
+    ('no', ParameterTypes.bool, False),
+    ('[1, 2]', ParameterTypes.any, [1, 2]),
+])
+def test_parse_parameter_value(text, ptype, expected):
+    value = parseParameterValue(text, ptype)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+@pytest.mark.parametrize('text, ptype', [
+    ('abc', ParameterTypes.integer),
+    ('1.5', ParameterTypes.integer),
+    ('abc', ParameterTypes.numeric),
+    ('abc', ParameterTypes.complex),
+])
+def test_parse_parameter_value_rejects_invalid(text, ptype):
+    with pytest.raises(ValueError):
+        parseParameterValue(text, ptype)
+
+
+def run_add_parameter(params, name, value, ptype=ParameterTypes.any):
+    runnable = _AddParameterRunnable(params, threading.RLock(), name, value, '', ptype)
+    ready, errors = [], []
+    runnable.signals.parameterReady.connect(ready.append)
+    runnable.signals.parameterError.connect(errors.append)
+    runnable.run()
+    return ready, errors
+
+
+def test_add_parameter():
+    params = ParameterManager(name='params')
+    ready, errors = run_add_parameter(params, 'a.b', '{[1]: 2}')
+    assert ready == ['a.b'] and errors == []
+    assert params.a.b() == '{[1]: 2}'
+
+
+def test_add_parameter_with_invalid_value_emits_error():
+    params = ParameterManager(name='params')
+    ready, errors = run_add_parameter(params, 'a', 'abc', ParameterTypes.integer)
+    assert ready == [] and len(errors) == 1
+    assert "'abc' is not a valid value" in errors[0]
+    assert 'a' not in params.parameters
+
+
+def test_add_existing_parameter_emits_error():
+    params = ParameterManager(name='params')
+    params.add_parameter('a', initial_value=1)
+    ready, errors = run_add_parameter(params, 'a', '2')
+    assert ready == [] and len(errors) == 1
+    assert errors[0].startswith('Could not create parameter. Adding parameter raised ')
+    assert params.a() == 1